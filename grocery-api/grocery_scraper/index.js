@@ -115,6 +115,56 @@ class GroceryScraper {
     }
 }
 
+// Long-lived worker mode: read one JSON request per line on stdin and
+// write one JSON response per line on stdout
+async function serve(scraper, writeJson) {
+    const readline = require('readline');
+    const rl = readline.createInterface({ input: process.stdin, terminal: false });
+
+    for await (const line of rl) {
+        if (!line.trim()) continue;
+
+        let response;
+        let requestId;
+        try {
+            const request = JSON.parse(line);
+            requestId = request.id;
+            const query = request.query;
+            const store = request.store;
+            const maxResults = parseInt(request.max) || 50;
+
+            if (store && Object.keys(scraper.scrapers).includes(store.toLowerCase())) {
+                const products = await scraper.scrapeStore(store, query, maxResults);
+                response = {
+                    success: true,
+                    query: query,
+                    store: store,
+                    products: products,
+                    totalResults: products.length
+                };
+            } else {
+                const results = await scraper.scrapeAllStores(query, maxResults);
+                const sortedProducts = scraper.sortByPrice(scraper.flattenResults(results));
+                response = {
+                    success: true,
+                    query: query,
+                    store: 'all',
+                    products: sortedProducts,
+                    totalResults: sortedProducts.length,
+                    storeResults: results
+                };
+            }
+        } catch (error) {
+            console.error('Error:', error.message);
+            response = { success: false, error: error.message };
+        }
+
+        // Echo the request id so the caller can match responses to requests
+        if (requestId !== undefined) response.id = requestId;
+        writeJson(response);
+    }
+}
+
 // Command line interface
 async function main() {
     const args = process.argv.slice(2);
@@ -125,6 +175,7 @@ Usage: node index.js <command> [options]
 
 Commands:
   search <query> [store] [maxResults]  - Search for products
+  --server                             - Serve JSON-line search requests over stdin/stdout
   help                                 - Show this help message
 
 Examples:
@@ -138,6 +189,14 @@ Supported stores: woolworths, coles, iga, harris, aldi
         return;
     }
 
+    // Check if JSON output is requested (for API usage)
+    const outputJson = args.includes('--json') || args[0] === '--server';
+    if (outputJson) {
+        // Keep stdout for the JSON document only; all logs go to stderr
+        console.log = console.error;
+    }
+    const writeJson = (payload) => process.stdout.write(JSON.stringify(payload) + '\n');
+
     const command = args[0];
     const scraper = new GroceryScraper();
 
@@ -152,9 +211,6 @@ Supported stores: woolworths, coles, iga, harris, aldi
                 const query = args[1];
                 const store = args[2];
                 const maxResults = parseInt(args[3]) || 50;
-                
-                // Check if JSON output is requested (for API usage)
-                const outputJson = args.includes('--json');
 
                 let results;
                 if (store && Object.keys(scraper.scrapers).includes(store.toLowerCase())) {
@@ -162,13 +218,13 @@ Supported stores: woolworths, coles, iga, harris, aldi
                     
                     if (outputJson) {
                         // Output JSON for API consumption
-                        console.log(JSON.stringify({
+                        writeJson({
                             success: true,
                             query: query,
                             store: store,
                             products: results,
                             totalResults: results.length
-                        }));
+                        });
                     } else {
                         // Human-readable output for CLI
                         console.log('\n=== RESULTS ===');
@@ -194,14 +250,14 @@ Supported stores: woolworths, coles, iga, harris, aldi
                         const allProducts = scraper.flattenResults(results);
                         const sortedProducts = scraper.sortByPrice(allProducts);
                         
-                        console.log(JSON.stringify({
+                        writeJson({
                             success: true,
                             query: query,
                             store: 'all',
                             products: sortedProducts,
                             totalResults: sortedProducts.length,
                             storeResults: results
-                        }));
+                        });
                     } else {
                         // Human-readable output for CLI
                         console.log('\n=== RESULTS BY STORE ===');
@@ -239,6 +295,10 @@ Supported stores: woolworths, coles, iga, harris, aldi
                 }
                 break;
 
+            case '--server':
+                await serve(scraper, writeJson);
+                break;
+
             case 'help':
                 console.log(`
 Grocery Scraper - Node.js Web Scraping Tool
@@ -0,0 +1,19 @@
+"""
+Gunicorn configuration for the Grocery API.
+
+The request handlers spend most of their time waiting on scraper I/O
+(HTTP calls and subprocesses), so gevent workers let each process keep many
+requests in flight instead of serializing them. gunicorn monkey-patches the
+standard library for gevent workers before the app is imported, so the
+shared requests sessions in the scrapers yield while waiting on sockets.
+"""
+import os
+
+bind = f"{os.getenv('FLASK_HOST', '0.0.0.0')}:{os.getenv('FLASK_PORT', '5002')}"
+workers = int(os.getenv('GUNICORN_WORKERS', '2'))
+worker_class = os.getenv('GUNICORN_WORKER_CLASS', 'gevent')
+worker_connections = int(os.getenv('GUNICORN_WORKER_CONNECTIONS', '200'))
+# Scrapers can take a while; keep the worker alive past the slowest store
+timeout = int(os.getenv('GUNICORN_TIMEOUT', '120'))
+accesslog = '-'
+errorlog = '-'
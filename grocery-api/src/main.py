@@ -1,25 +1,89 @@
 import os
 import sys
+import logging
 # DON'T CHANGE THIS !!!
 sys.path.insert(0, os.path.dirname(os.path.dirname(__file__)))
 
+# Configure logging once for the whole app, before the blueprints and scrapers are imported
+logging.basicConfig(
+    level=logging.INFO,
+    format='%(asctime)s - %(levelname)s - %(message)s',
+    stream=sys.stdout
+)
+
 from flask import Flask, send_from_directory, jsonify
+from flask.json.provider import DefaultJSONProvider
 from flask_cors import CORS
 from dotenv import load_dotenv
 from src.routes.grocery import grocery_bp
 from src.routes.merger import merger_bp
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    from flask_compress import Compress
+except ImportError:
+    Compress = None
+
 # Load environment variables from .env file
 load_dotenv()
 
+
+class OrjsonProvider(DefaultJSONProvider):
+    """Flask JSON provider backed by orjson, falling back to the stdlib for unsupported payloads"""
+
+    def _option(self, sort_keys, indent):
+        option = orjson.OPT_NON_STR_KEYS
+        if sort_keys:
+            option |= orjson.OPT_SORT_KEYS
+        if indent:
+            option |= orjson.OPT_INDENT_2
+        return option
+
+    def dumps(self, obj, **kwargs):
+        option = self._option(kwargs.get('sort_keys', self.sort_keys), kwargs.get('indent'))
+        try:
+            return orjson.dumps(obj, default=self.default, option=option).decode()
+        except TypeError:
+            return super().dumps(obj, **kwargs)
+
+    def loads(self, s, **kwargs):
+        return orjson.loads(s)
+
+    def response(self, *args, **kwargs):
+        """Build jsonify responses straight from orjson bytes, skipping the str round-trip"""
+        obj = self._prepare_response_obj(args, kwargs)
+        indent = (self.compact is None and self._app.debug) or self.compact is False
+        option = self._option(self.sort_keys, indent) | orjson.OPT_APPEND_NEWLINE
+        try:
+            body = orjson.dumps(obj, default=self.default, option=option)
+        except TypeError:
+            return super().response(*args, **kwargs)
+        return self._app.response_class(body, mimetype=self.mimetype)
+
+
 app = Flask(__name__, static_folder=os.path.join(os.path.dirname(__file__), 'static'))
 
+# Use orjson for request/response JSON when it is installed
+if orjson is not None:
+    app.json = OrjsonProvider(app)
+
 # Get configuration from environment variables
 SECRET_KEY = os.getenv('SECRET_KEY', 'asdf#FGSgvasgf$5$WGT')
 CORS_ORIGINS = os.getenv('CORS_ORIGINS', 'http://localhost:5173,http://127.0.0.1:5173')
 
 app.config['SECRET_KEY'] = SECRET_KEY
 
+# Compress JSON responses over 1KB (product lists are highly repetitive), preferring brotli
+app.config['COMPRESS_MIMETYPES'] = ['application/json']
+app.config['COMPRESS_MIN_SIZE'] = 1024
+app.config['COMPRESS_ALGORITHM'] = ['br', 'gzip']
+if Compress is not None:
+    Compress(app)
+
 # Enable CORS for all routes - convert comma-separated string to list
 cors_origins_list = [origin.strip() for origin in CORS_ORIGINS.split(',')]
 CORS(app, origins=cors_origins_list)
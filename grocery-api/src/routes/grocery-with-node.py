@@ -1,14 +1,30 @@
 from flask import Blueprint, request, jsonify, send_file
 from flask_cors import cross_origin
+from concurrent.futures import ThreadPoolExecutor, wait
 import subprocess
+import atexit
 import json
 import os
-import hashlib
 import time
 import sys
+import hashlib
 import logging
 import random
 import shutil
+import threading
+import queue
+import itertools
+import tempfile
+import select
+from collections import OrderedDict
+from functools import lru_cache
+
+# orjson decodes the scraper's product payloads several times faster than the stdlib
+try:
+    import orjson
+    json_loads = orjson.loads
+except ImportError:
+    json_loads = json.loads
 
 # Import the Python scrapers from local scrapers module
 try:
@@ -26,8 +42,7 @@ except ImportError as e:
 
 grocery_bp = Blueprint('grocery', __name__)
 
-# Configure logging
-logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+# Logging is configured once by the app entry point (src/main.py)
 logger = logging.getLogger(__name__)
 
 def get_store_logo_url(store_name, api_base_url=None):
@@ -74,10 +89,7 @@ def get_store_logo_url(store_name, api_base_url=None):
     return f"{api_base_url}/logos/{logo_filename}"
 
 def log_and_print(message, level='info'):
-    """Print message to console and log it with proper flushing"""
-    print(message)
-    sys.stdout.flush()  # Force flush the output buffer
-    
+    """Log message once using the configured logger"""
     if level.lower() == 'info':
         logger.info(message)
     elif level.lower() == 'error':
@@ -87,37 +99,76 @@ def log_and_print(message, level='info'):
     elif level.lower() == 'debug':
         logger.debug(message)
 
-# In-memory cache for search results
-search_cache = {}
+# In-memory cache for search results, oldest entries first: key -> {'products', 'timestamp'}.
+# Timestamps come from time.monotonic() so wall-clock adjustments can't expire or extend entries
+search_cache = OrderedDict()
 CACHE_DURATION = 300  # 5 minutes in seconds
+CACHE_MAX_ENTRIES = 1024
+search_cache_lock = threading.Lock()
+
+def price_sort_key(product):
+    """Sort key for cheapest-first ordering; products without a price sort last"""
+    # A module-level function instead of a lambda built at every sort call
+    price = product.get('numericPrice')
+    return float('inf') if price is None else price
 
 def get_cache_key(query, store):
     """Generate a cache key for the search parameters"""
-    return hashlib.md5(f"{query.lower()}:{store}".encode()).hexdigest()
+    # The dict hashes the tuple itself; no need for a cryptographic digest
+    return (query.lower(), store)
 
 def is_cache_valid(cache_entry):
     """Check if cache entry is still valid"""
-    return time.time() - cache_entry['timestamp'] < CACHE_DURATION
+    return time.monotonic() - cache_entry['timestamp'] < CACHE_DURATION
 
-def run_python_scrapers(query, store='all', max_results=200):
-    """Run the Python scrapers for ALDI and IGA"""
+def get_search_cache(key):
+    """Return the cached products for key, or None if they are missing or expired"""
+    # One dict lookup instead of `in` followed by two `[]` reads
+    entry = search_cache.get(key)
+    if entry is None or not is_cache_valid(entry):
+        return None
+    return entry['products']
+
+def set_search_cache(key, products):
+    """Cache products under key, dropping expired entries and the oldest ones beyond CACHE_MAX_ENTRIES"""
+    now = time.monotonic()
+    with search_cache_lock:
+        search_cache.pop(key, None)
+        # Entries are kept in insertion order, so expired ones are always at the front
+        while search_cache and now - next(iter(search_cache.values()))['timestamp'] >= CACHE_DURATION:
+            search_cache.popitem(last=False)
+        while len(search_cache) >= CACHE_MAX_ENTRIES:
+            search_cache.popitem(last=False)
+        search_cache[key] = {'products': products, 'timestamp': now}
+
+PYTHON_SCRAPER_TIMEOUT = 30  # seconds to wait for the ALDI and IGA scrapers
+
+def run_python_scrapers(query, store='all', max_results=200, timeout_seconds=PYTHON_SCRAPER_TIMEOUT):
+    """Run the Python scrapers for ALDI and IGA
+    
+    Stores that haven't finished after timeout_seconds are left out of the products
+    and listed under 'timed_out_stores'
+    """
+    # One UTC timestamp per scrape, shared by every standardized product
+    scraped_at = time.strftime('%Y-%m-%dT%H:%M:%SZ', time.gmtime())
+    
     try:
-        all_products = []
-        
-        if store == 'all' or store == 'aldi-py':
+        def scrape_aldi():
+            products = []
             try:
                 log_and_print(f"LN-64: Scraping ALDI for: {query}")
                 aldi_products = fetch_aldi_products_with_discount(query, limit=min(max_results, 100))
                 
                 # Convert ALDI products to standard format
                 for product in aldi_products:
-                    log_and_print(f"LN-69: Product: {product}")
+                    logger.debug("LN-69: Product: %s", product)
+                    discount_price = product.get('discount_price', '')
                     standardized_product = {
                         'title': product.get('name', ''),
                         'store': 'Aldi',
                         'price': product.get('price', ''),
-                        'discountedPrice': product.get('discount_price', ''),
-                        'discount': f"Was {product.get('discount_price')}" if product.get('discount_price') else '',
+                        'discountedPrice': discount_price,
+                        'discount': f"Was {discount_price}" if discount_price else '',
                         'numericPrice': aldi_parse_price(product.get('price', '0')),
                         'inStock': True,  # Assume in stock if returned by API
                         'unitPrice': '',  # Not available in ALDI scraper
@@ -125,26 +176,29 @@ def run_python_scrapers(query, store='all', max_results=200):
                         'brand': '',  # Extract from name if needed
                         'category': '',  # Not available in ALDI scraper
                         'productUrl': '',  # Not available in ALDI scraper
-                        'scraped_at': time.strftime('%Y-%m-%dT%H:%M:%SZ')
+                        'scraped_at': scraped_at
                     }
-                    all_products.append(standardized_product)
+                    products.append(standardized_product)
                     
             except Exception as e:
                 log_and_print(f"Error scraping ALDI: {e}", 'error')
+            return products
         
-        if store == 'all' or store == 'iga-py':
+        def scrape_iga():
+            products = []
             try:
                 log_and_print(f"LN-91: Scraping IGA for: {query}")
                 iga_products = fetch_iga_products(query, limit=min(max_results, 100))
                 
                 # Convert IGA products to standard format
                 for product in iga_products:
+                    discount_price = product.get('discount_price')
                     standardized_product = {
                         'title': product.get('name', ''),
                         'store': 'IGA',
                         'price': str(product.get('price', '')),
-                        'discountedPrice': str(product.get('discount_price', '')) if product.get('discount_price') else '',
-                        'discount': f"Was {product.get('discount_price')}" if product.get('discount_price') else '',
+                        'discountedPrice': str(discount_price) if discount_price else '',
+                        'discount': f"Was {discount_price}" if discount_price else '',
                         'numericPrice': iga_parse_price(str(product.get('price', '0'))),
                         'inStock': True,  # Assume in stock if returned by API
                         'unitPrice': '',  # Not available in IGA scraper
@@ -152,63 +206,305 @@ def run_python_scrapers(query, store='all', max_results=200):
                         'brand': '',  # Extract from name if needed
                         'category': '',  # Not available in IGA scraper
                         'productUrl': '',  # Not available in IGA scraper
-                        'scraped_at': time.strftime('%Y-%m-%dT%H:%M:%SZ')
+                        'scraped_at': scraped_at
                     }
-                    all_products.append(standardized_product)
+                    products.append(standardized_product)
                     
             except Exception as e:
                 log_and_print(f"Error scraping IGA: {e}", 'error')
+            return products
+        
+        tasks = []
+        if store == 'all' or store == 'aldi-py':
+            tasks.append(('aldi', scrape_aldi))
+        if store == 'all' or store == 'iga-py':
+            tasks.append(('iga', scrape_iga))
+        
+        # Both scrapers wait on remote HTTP, so run them side by side; the search then
+        # takes as long as the slower store instead of the sum of both, capped at timeout_seconds.
+        # Each call gets its own threads, so a hung scraper can't hold up later searches
+        executor = ThreadPoolExecutor(max_workers=max(len(tasks), 1), thread_name_prefix='scraper')
+        try:
+            futures = [executor.submit(fn) for name, fn in tasks]
+            wait(futures, timeout=timeout_seconds)
+        finally:
+            # Don't block on scrapers that are still running; their threads exit when they finish
+            executor.shutdown(wait=False)
+        
+        # Collect in store order so ALDI products still come first
+        all_products = []
+        timed_out_stores = []
+        for (name, fn), future in zip(tasks, futures):
+            if not future.done():
+                log_and_print(f"{name.upper()} scraper timed out after {timeout_seconds} seconds", 'warning')
+                timed_out_stores.append(name)
+                continue
+            all_products.extend(future.result())
         
-        return {'products': all_products}
+        result = {'products': all_products}
+        if timed_out_stores:
+            result['timed_out_stores'] = timed_out_stores
+        return result
         
     except Exception as e:
         return {"error": f"Failed to run Python scrapers: {str(e)}"}
 
-def run_node_scraper(query, store='all', max_results=200):
-    """Run the Node.js scraper using subprocess"""
-    try:
-        log_and_print(f"LN-124: Running Node.js scraper for: {query}")
-        # Get the path to the grocery_scraper directory with multiple fallbacks
-        current_dir = os.path.dirname(os.path.abspath(__file__))
-        
-        # Try multiple possible paths for the grocery_scraper directory
-        possible_paths = [
-            '/home/ec2-user/apps/scrapper/grocery-api/grocery_scraper',  # Exact production path
-            os.path.join(current_dir, '..', '..', 'grocery_scraper'),   # Original development path
-            os.path.join(current_dir, '..', 'grocery_scraper'),         # One level up
-            os.path.join(os.path.dirname(current_dir), 'grocery_scraper'),  # Same level as src
-            '/app/grocery_scraper',      # Docker production path
-            './grocery_scraper',         # Relative path
-        ]
-        
-        grocery_scraper_path = None
-        for path in possible_paths:
-            if os.path.exists(path) and os.path.isfile(os.path.join(path, 'index.js')):
-                grocery_scraper_path = path
-                log_and_print(f"Found grocery_scraper at: {path}")
+# TTL cache of parsed Node.js scraper results keyed by (query, store, max_results)
+node_result_cache = OrderedDict()
+NODE_CACHE_TTL = 120  # seconds
+NODE_CACHE_MAXSIZE = 512
+node_result_cache_lock = threading.Lock()
+
+def get_cached_node_result(key):
+    """Return the cached parsed scraper result for key, or None if missing/expired"""
+    with node_result_cache_lock:
+        entry = node_result_cache.get(key)
+        if entry is None:
+            return None
+        if time.monotonic() - entry['timestamp'] >= NODE_CACHE_TTL:
+            del node_result_cache[key]
+            return None
+        # Mark as most recently used so eviction drops the least recently used entries
+        node_result_cache.move_to_end(key)
+        return entry['result']
+
+def set_cached_node_result(key, result):
+    """Store a parsed scraper result, evicting the least recently used entries when full"""
+    with node_result_cache_lock:
+        node_result_cache.pop(key, None)
+        while len(node_result_cache) >= NODE_CACHE_MAXSIZE:
+            node_result_cache.popitem(last=False)
+        node_result_cache[key] = {'result': result, 'timestamp': time.monotonic()}
+
+# Directory of this module, resolved once at import
+CURRENT_DIR = os.path.dirname(os.path.abspath(__file__))
+
+# Local logos directory within grocery-api
+LOGOS_PATH = os.path.join(CURRENT_DIR, '..', '..', 'logos')
+
+# Possible locations of the grocery_scraper directory, in priority order
+GROCERY_SCRAPER_PATHS = [
+    '/home/ec2-user/apps/scrapper/grocery-api/grocery_scraper',  # Exact production path
+    os.path.join(CURRENT_DIR, '..', '..', 'grocery_scraper'),   # Original development path
+    os.path.join(CURRENT_DIR, '..', 'grocery_scraper'),         # One level up
+    os.path.join(os.path.dirname(CURRENT_DIR), 'grocery_scraper'),  # Same level as src
+    '/app/grocery_scraper',      # Docker production path
+    './grocery_scraper',         # Relative path
+]
+
+# Fallback locations for the node executable when it is not on PATH
+NODE_EXECUTABLE_PATHS = [
+    '/usr/bin/node',
+    '/usr/local/bin/node',
+    '/home/ec2-user/.nvm/versions/node/v20.19.4/bin/node'
+]
+
+# Node executable, scraper directory and environment, found on the first successful lookup
+node_setup = None
+
+def resolve_node_setup():
+    """Locate node and grocery_scraper once; later calls reuse the result"""
+    global node_setup
+    if node_setup is not None:
+        return node_setup
+    
+    grocery_scraper_path = None
+    for path in GROCERY_SCRAPER_PATHS:
+        if os.path.exists(path) and os.path.isfile(os.path.join(path, 'index.js')):
+            grocery_scraper_path = path
+            logger.debug("Found grocery_scraper at: %s", path)
+            break
+    
+    if not grocery_scraper_path:
+        return {"error": f"Could not find grocery_scraper directory. Tried: {GROCERY_SCRAPER_PATHS}"}
+    
+    # Get the full path to node executable
+    node_path = shutil.which('node')
+    if not node_path:
+        for path in NODE_EXECUTABLE_PATHS:
+            if os.path.exists(path):
+                node_path = path
                 break
         
-        if not grocery_scraper_path:
-            return {"error": f"Could not find grocery_scraper directory. Tried: {possible_paths}"}
-        
-        # Get the full path to node executable
-        node_path = shutil.which('node')
         if not node_path:
-            # Fallback paths for node
-            possible_node_paths = [
-                '/usr/bin/node',
-                '/usr/local/bin/node',
-                '/home/ec2-user/.nvm/versions/node/v20.19.4/bin/node'
-            ]
-            for path in possible_node_paths:
-                if os.path.exists(path):
-                    node_path = path
-                    break
-            
-            if not node_path:
-                return {"error": "Could not find node executable"}
+            return {"error": "Could not find node executable"}
+    
+    logger.debug("Using node at: %s", node_path)
+    
+    # Set up proper environment
+    env = os.environ.copy()
+    env['PATH'] = f"/home/ec2-user/.nvm/versions/node/v20.19.4/bin:{env.get('PATH', '')}"
+    env['NODE_PATH'] = f"{grocery_scraper_path}/node_modules"
+    
+    node_setup = {'node_path': node_path, 'grocery_scraper_path': grocery_scraper_path, 'env': env}
+    return node_setup
+
+# Set USE_NODE_SCRAPER=false to serve ALDI/IGA from the in-process Python scrapers only
+USE_NODE_SCRAPER = os.environ.get('USE_NODE_SCRAPER', 'true').lower() == 'true'
+
+# Pool of long-lived Node.js workers (node index.js --server) speaking JSON lines over stdio
+USE_NODE_WORKERS = os.environ.get('USE_NODE_WORKERS', 'true').lower() == 'true'
+NODE_WORKER_COUNT = int(os.environ.get('NODE_WORKER_COUNT', '4'))
+NODE_WORKER_TIMEOUT = 90  # seconds
+node_worker_pool = queue.Queue()
+node_worker_pool_lock = threading.Lock()
+node_workers_started = False
+node_request_ids = itertools.count(1)
+
+def start_node_worker(node_path, grocery_scraper_path, env):
+    """Launch a Node.js scraper worker in --server mode"""
+    # stderr is inherited so worker logs reach the server log without filling an unread pipe.
+    # The pipes stay binary: responses go to the JSON decoder as bytes, with no text decoding
+    return subprocess.Popen(
+        [node_path, 'index.js', '--server'],
+        cwd=grocery_scraper_path,
+        stdin=subprocess.PIPE,
+        stdout=subprocess.PIPE,
+        env=env
+    )
+
+def stop_node_worker(worker):
+    """Kill a worker and reap the process"""
+    try:
+        worker.kill()
+        worker.wait(timeout=5)
+    except Exception as e:
+        log_and_print(f"Error stopping Node.js worker: {e}", 'warning')
+
+def ensure_node_workers(node_path, grocery_scraper_path, env):
+    """Start the worker pool on first use"""
+    global node_workers_started
+    with node_worker_pool_lock:
+        if node_workers_started:
+            return
+        for _ in range(NODE_WORKER_COUNT):
+            node_worker_pool.put(start_node_worker(node_path, grocery_scraper_path, env))
+        node_workers_started = True
+        log_and_print(f"Started {NODE_WORKER_COUNT} Node.js scraper workers")
+
+def stop_node_workers():
+    """Stop every idle pooled worker; registered to run at interpreter exit"""
+    while True:
+        try:
+            worker = node_worker_pool.get_nowait()
+        except queue.Empty:
+            break
+        stop_node_worker(worker)
+
+atexit.register(stop_node_workers)
+
+NODE_WORKER_READ_SIZE = 1 << 20  # bytes per os.read while collecting a response line
+
+def read_worker_line(worker, timeout):
+    """
+    Read one newline-terminated response from a worker, giving up after timeout seconds
+    
+    Reads the raw pipe with os.read, so a partial line can't block past the deadline the way
+    a buffered readline() can. Returns the line, b'' if the worker closed its stdout first,
+    or None on timeout.
+    """
+    deadline = time.monotonic() + timeout
+    fd = worker.stdout.fileno()
+    buffer = bytearray()
+    search_from = 0
+    while True:
+        newline = buffer.find(b'\n', search_from)
+        if newline != -1:
+            # Workers answer one request at a time, so nothing follows the newline
+            return bytes(buffer[:newline + 1])
+        search_from = len(buffer)
+        
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            return None
+        ready, _, _ = select.select([fd], [], [], remaining)
+        if not ready:
+            return None
+        chunk = os.read(fd, NODE_WORKER_READ_SIZE)
+        if not chunk:
+            return b''
+        buffer += chunk
+
+def run_node_worker_request(query, store, max_results, node_path, grocery_scraper_path, env):
+    """Send one search request to a pooled Node.js worker and return the parsed response"""
+    ensure_node_workers(node_path, grocery_scraper_path, env)
+    worker = node_worker_pool.get()
+    try:
+        # Replace workers that have exited since their last request
+        if worker.poll() is not None:
+            log_and_print("Node.js worker exited, starting a new one", 'warning')
+            worker = start_node_worker(node_path, grocery_scraper_path, env)
+        
+        request_id = next(node_request_ids)
+        worker.stdin.write(json.dumps({'id': request_id, 'query': query, 'store': store, 'max': max_results}).encode() + b'\n')
+        worker.stdin.flush()
+        
+        line = read_worker_line(worker, NODE_WORKER_TIMEOUT)
+        if line is None:
+            stop_node_worker(worker)
+            worker = start_node_worker(node_path, grocery_scraper_path, env)
+            return {"error": f"Scraper timed out after {NODE_WORKER_TIMEOUT} seconds"}
+        if not line:
+            stop_node_worker(worker)
+            worker = start_node_worker(node_path, grocery_scraper_path, env)
+            return {"error": "Node.js worker exited without a response"}
         
-        log_and_print(f"Using node at: {node_path}")
+        try:
+            response = json_loads(line)
+        except json.JSONDecodeError as e:
+            return {"error": f"Failed to parse JSON output: {e}", "stdout": line.decode('utf-8', 'replace')}
+        
+        # A response for another request means the worker's stream is out of step; replace it
+        if isinstance(response, dict) and response.pop('id', request_id) != request_id:
+            stop_node_worker(worker)
+            worker = start_node_worker(node_path, grocery_scraper_path, env)
+            return {"error": "Node.js worker returned a response for a different request"}
+        return response
+    except (BrokenPipeError, OSError) as e:
+        stop_node_worker(worker)
+        worker = start_node_worker(node_path, grocery_scraper_path, env)
+        return {"error": f"Node.js worker failed: {e}"}
+    finally:
+        node_worker_pool.put(worker)
+
+NODE_SCRAPER_TIMEOUT = 90  # seconds for a one-shot CLI run
+
+def reap_node_process(proc, stderr_file, timeout=30):
+    """Wait for a one-shot scraper to exit after its result has been read, killing it if it hangs"""
+    try:
+        proc.wait(timeout=timeout)
+    except subprocess.TimeoutExpired:
+        proc.kill()
+        proc.wait()
+    finally:
+        proc.stdout.close()
+        stderr_file.close()
+
+def run_node_scraper(query, store='all', max_results=200, use_cache=True):
+    """Run the Node.js scraper using subprocess"""
+    # Serve repeated searches from the parsed-result cache to skip the subprocess and JSON decode
+    cache_key = (query.lower().strip(), store, max_results)
+    if use_cache:
+        cached_result = get_cached_node_result(cache_key)
+        if cached_result is not None:
+            log_and_print(f"Using cached Node.js result for: {query}")
+            return cached_result
+    
+    try:
+        log_and_print(f"LN-124: Running Node.js scraper for: {query}")
+        node_setup = resolve_node_setup()
+        if 'error' in node_setup:
+            return node_setup
+        node_path = node_setup['node_path']
+        grocery_scraper_path = node_setup['grocery_scraper_path']
+        env = node_setup['env']
+        
+        # Prefer a long-lived worker to avoid paying Node startup on every request
+        if USE_NODE_WORKERS:
+            json_output = run_node_worker_request(query, store, max_results, node_path, grocery_scraper_path, env)
+            if 'error' not in json_output:
+                set_cached_node_result(cache_key, json_output)
+            return json_output
         
         # Prepare the command to run the Node.js scraper
         cmd = [node_path, 'index.js', 'search', query]
@@ -222,54 +518,86 @@ def run_node_scraper(query, store='all', max_results=200):
         cmd.append('--json')
         
         # Log the exact command being run
-        log_and_print(f"Running command: {' '.join(cmd)} in directory: {grocery_scraper_path}")
-        
-        # Set up proper environment
-        env = os.environ.copy()
-        env['PATH'] = f"/home/ec2-user/.nvm/versions/node/v20.19.4/bin:{env.get('PATH', '')}"
-        env['NODE_PATH'] = f"{grocery_scraper_path}/node_modules"
+        logger.debug("Running command: %s in directory: %s", cmd, grocery_scraper_path)
         
-        # Run the Node.js script with proper environment
-        result = subprocess.run(
+        # Run the Node.js script with proper environment. stdout is read as bytes line by line
+        # so the JSON document goes straight to the decoder and reading stops as soon as it
+        # arrives; stderr goes to a temp file so it can't fill a pipe while nobody reads it
+        stderr_file = tempfile.TemporaryFile()
+        proc = subprocess.Popen(
             cmd,
             cwd=grocery_scraper_path,
-            capture_output=True,
-            text=True,
-            timeout=90,  # Increase timeout to 90 seconds
+            stdin=subprocess.DEVNULL,  # The CLI never reads stdin
+            stdout=subprocess.PIPE,
+            stderr=stderr_file,
             env=env      # Pass the environment
         )
         
-        # Log subprocess results for debugging
-        log_and_print(f"Subprocess return code: {result.returncode}")
-        if result.stdout:
-            log_and_print(f"Subprocess stdout: {result.stdout[:500]}...")  # First 500 chars
-        if result.stderr:
-            log_and_print(f"Subprocess stderr: {result.stderr}")
+        # Killing the scraper closes its stdout, which ends the read loop below
+        timed_out = threading.Event()
+        def kill_on_timeout():
+            timed_out.set()
+            proc.kill()
+        timer = threading.Timer(NODE_SCRAPER_TIMEOUT, kill_on_timeout)
+        timer.start()
         
-        if result.returncode == 0:
-            # Parse the JSON output from the Node.js script
-            try:
-                output_lines = result.stdout.strip().split('\n')
-                # Find the last line that looks like JSON (in case there are other log messages)
-                json_output = None
-                for line in reversed(output_lines):
+        json_output = None
+        other_lines = []
+        try:
+            # With --json the scraper writes the result as a single line (logs go to stderr)
+            for line in proc.stdout:
+                stripped = line.strip()
+                if stripped.startswith((b'{', b'[')):
                     try:
-                        json_output = json.loads(line)
+                        json_output = json_loads(stripped)
                         break
                     except json.JSONDecodeError:
-                        continue
-                
-                if json_output:
-                    return json_output
-                else:
-                    return {"error": "No valid JSON output from scraper", "stdout": result.stdout, "stderr": result.stderr}
+                        pass
+                other_lines.append(line)
+        finally:
+            timer.cancel()
+        
+        if timed_out.is_set():
+            proc.wait()
+            proc.stdout.close()
+            stderr_file.close()
+            return {"error": f"Scraper timed out after {NODE_SCRAPER_TIMEOUT} seconds"}
+        
+        if json_output is not None:
+            # The scraper still closes its browsers after writing the result; reap it in the background
+            threading.Thread(target=reap_node_process, args=(proc, stderr_file), daemon=True).start()
+            if 'error' not in json_output:
+                set_cached_node_result(cache_key, json_output)
+            return json_output
+        
+        proc.wait()
+        proc.stdout.close()
+        stderr_file.seek(0)
+        stderr = stderr_file.read()
+        stderr_file.close()
+        stdout = b''.join(other_lines)
+        
+        # Lazy debug logging so the output dumps cost nothing unless DEBUG is enabled
+        logger.debug("Subprocess return code: %s", proc.returncode)
+        if stdout:
+            logger.debug("Subprocess stdout: %.500r...", stdout)  # First 500 chars
+        if stderr:
+            logger.debug("Subprocess stderr: %r", stderr)
+        
+        if proc.returncode == 0:
+            # Older scraper builds may print the document across several lines
+            try:
+                json_output = json_loads(stdout)
             except json.JSONDecodeError as e:
-                return {"error": f"Failed to parse JSON output: {e}", "stdout": result.stdout, "stderr": result.stderr}
+                return {"error": f"Failed to parse JSON output: {e}", "stdout": stdout.decode('utf-8', 'replace'), "stderr": stderr.decode('utf-8', 'replace')}
+            if json_output:
+                if 'error' not in json_output:
+                    set_cached_node_result(cache_key, json_output)
+                return json_output
+            return {"error": "No valid JSON output from scraper", "stdout": stdout.decode('utf-8', 'replace'), "stderr": stderr.decode('utf-8', 'replace')}
         else:
-            return {"error": f"Scraper failed with return code {result.returncode}", "stdout": result.stdout, "stderr": result.stderr}
+            return {"error": f"Scraper failed with return code {proc.returncode}", "stdout": stdout.decode('utf-8', 'replace'), "stderr": stderr.decode('utf-8', 'replace')}
     
-    except subprocess.TimeoutExpired:
-        return {"error": "Scraper timed out after 90 seconds"}
     except Exception as e:
         return {"error": f"Failed to run scraper: {str(e)}"}
 
@@ -278,12 +606,14 @@ def run_node_scraper(query, store='all', max_results=200):
 def search_products():
     """Search for products across all stores or a specific store using Node.js scraper with caching"""
     try:
-        data = request.get_json()
+        # silent=True turns a malformed body into a 400 below instead of an exception
+        data = request.get_json(silent=True) or {}
         
-        if not data or 'query' not in data:
+        query = data.get('query')
+        if not isinstance(query, str):
             return jsonify({'error': 'Query parameter is required'}), 400
         
-        query = data['query'].strip()
+        query = query.strip()
         if not query:
             return jsonify({'error': 'Query cannot be empty'}), 400
         
@@ -297,26 +627,47 @@ def search_products():
         
         page = data.get('page', 1)
         per_page = data.get('perPage', 10)
+        # ?nocache=1 bypasses both the search cache and the Node.js result cache
+        use_cache = request.args.get('nocache') != '1'
         
         # Generate cache key
         cache_key = get_cache_key(query, store)
         
         # Check if we have cached results that are still valid
-        if cache_key in search_cache and is_cache_valid(search_cache[cache_key]):
+        all_products = get_search_cache(cache_key) if use_cache else None
+        cached = all_products is not None
+        if cached:
             log_and_print(f"LN-199: Using cached results for query: {query}, store: {store}")
-            all_products = search_cache[cache_key]['products']
         else:
             log_and_print(f"LN-201: Fetching fresh results for query: {query}, store: {store}")
             
             # Priority: Use Python scrapers for ALDI and IGA, fallback to Node.js
             scraper_result = {"products": []}
+            timed_out_stores = []
             
-            # Always use Node.js scraper for production reliability
-            # Only use Python scrapers if specifically requested with -py suffix
-            if PYTHON_SCRAPERS_AVAILABLE and store in ['aldi-py', 'iga-py']:
-                log_and_print("Using Python scrapers (explicitly requested)")
-                python_store = store.replace('-py', '')  # Convert aldi-py -> aldi
+            # Use Python scrapers when requested with -py suffix, or for ALDI/IGA when the
+            # Node.js scraper is disabled; run_python_scrapers expects 'all' or '<store>-py'
+            python_store = None
+            if store in ['aldi-py', 'iga-py']:
+                python_store = store
+            elif not USE_NODE_SCRAPER and store in ['all', 'aldi', 'iga']:
+                python_store = store if store == 'all' else f"{store}-py"
+
+            # Without the Node.js scraper nothing could serve this store; say so instead of
+            # returning (and caching) an empty result
+            if not USE_NODE_SCRAPER and not python_store:
+                return jsonify({
+                    'error': f'Store "{store}" requires the Node.js scraper, which is disabled (USE_NODE_SCRAPER=false)'
+                }), 503
+            if not USE_NODE_SCRAPER and not PYTHON_SCRAPERS_AVAILABLE:
+                return jsonify({
+                    'error': 'Python scrapers are not available and the Node.js scraper is disabled (USE_NODE_SCRAPER=false)'
+                }), 503
+
+            if PYTHON_SCRAPERS_AVAILABLE and python_store:
+                log_and_print(f"Using Python scrapers for: {python_store}")
                 scraper_result = run_python_scrapers(query, python_store, max_results=200)
+                timed_out_stores = scraper_result.get('timed_out_stores', [])
                 
                 if 'error' in scraper_result:
                     log_and_print(f"Python scrapers failed: {scraper_result['error']}")
@@ -327,11 +678,12 @@ def search_products():
                     log_and_print("Python scrapers returned no products")
             
             # Use Node.js scraper for all stores (including aldi, iga) unless -py explicitly requested
-            if (not scraper_result.get('products') or 
-                store not in ['aldi-py', 'iga-py']):
+            # or the Node.js scraper is disabled
+            if USE_NODE_SCRAPER and (not scraper_result.get('products') or 
+                                     store not in ['aldi-py', 'iga-py']):
                 
                 log_and_print("Using Node.js scraper")
-                node_result = run_node_scraper(query, store, max_results=50)
+                node_result = run_node_scraper(query, store, max_results=50, use_cache=use_cache)
                 
                 if 'error' not in node_result:
                     # Merge with existing Python results if any
@@ -360,39 +712,34 @@ def search_products():
 
             all_products = []
             for p in raw_products:
-                # Map existing fields and add missing ones
-                store_name = p.get("store", store)
-                product = {
-                    "title": p.get("title", "N/A"),
+                # Map existing fields and add missing ones, reading each raw field once
+                get = p.get
+                store_name = get("store", store)
+                numeric_price = get("numericPrice", 0)
+                all_products.append({
+                    "title": get("title", "N/A"),
                     "store": store_name,  # Use the actual store from scraped product, fallback to request store
                     "store_logo": get_store_logo_url(store_name),  # Add store logo URL
-                    "price": p.get("price", f"${p.get('numericPrice', 0):.2f}"),
-                    "discountedPrice": p.get("discountedPrice", ""),
-                    "discount": p.get("discount", ""),
-                    "numericPrice": p.get("numericPrice", 0),
-                    "inStock": p.get("inStock", True),  # Use actual inStock value from scraper
-                    "unitPrice": p.get("unitPrice", ""),
-                    "imageUrl": p.get("imageUrl", ""),
-                    "brand": p.get("brand", ""),
-                    "category": p.get("category", ""),
-                    "productUrl": p.get("productUrl", ""),
-                    "scraped_at": p.get("scraped_at", "")
-                }
-
-                # Use discount field from scraper if not already set
-                if not product["discount"] and p.get("discount"):
-                    product["discount"] = p.get("discount")
-
-                all_products.append(product)
+                    # Only format a fallback price for products that have none
+                    "price": p["price"] if "price" in p else f"${numeric_price:.2f}",
+                    "discountedPrice": get("discountedPrice", ""),
+                    "discount": get("discount", ""),
+                    "numericPrice": numeric_price,
+                    "inStock": get("inStock", True),  # Use actual inStock value from scraper
+                    "unitPrice": get("unitPrice", ""),
+                    "imageUrl": get("imageUrl", ""),
+                    "brand": get("brand", ""),
+                    "category": get("category", ""),
+                    "productUrl": get("productUrl", ""),
+                    "scraped_at": get("scraped_at", "")
+                })
             
             # Sort by price (cheapest first)
-            all_products.sort(key=lambda x: x.get('numericPrice', float('inf')))
+            all_products.sort(key=price_sort_key)
             
-            # Cache the results
-            search_cache[cache_key] = {
-                'products': all_products,
-                'timestamp': time.time()
-            }
+            # Cache the results, unless a store timed out and they are incomplete
+            if not timed_out_stores:
+                set_search_cache(cache_key, all_products)
         
         # Apply pagination to cached results
         start_idx = (page - 1) * per_page
@@ -411,7 +758,7 @@ def search_products():
             'currentPageResults': len(paginated_products),
             'hasMore': has_more,
             'products': paginated_products,
-            'cached': cache_key in search_cache and is_cache_valid(search_cache[cache_key])
+            'cached': cached
         })
     
     except Exception as e:
@@ -443,20 +790,10 @@ def get_stores():
 def health_check():
     """Health check endpoint"""
     # Test grocery_scraper path resolution
-    current_dir = os.path.dirname(os.path.abspath(__file__))
-    possible_paths = [
-        '/home/ec2-user/apps/scrapper/grocery-api/grocery_scraper',  # Exact production path
-        os.path.join(current_dir, '..', '..', 'grocery_scraper'),   # Original development path
-        os.path.join(current_dir, '..', 'grocery_scraper'),         # One level up
-        os.path.join(os.path.dirname(current_dir), 'grocery_scraper'),  # Same level as src
-        '/app/grocery_scraper',      # Docker production path
-        './grocery_scraper',         # Relative path
-    ]
-    
     found_paths = []
     grocery_scraper_found = False
     
-    for path in possible_paths:
+    for path in GROCERY_SCRAPER_PATHS:
         if os.path.exists(path):
             index_js_exists = os.path.isfile(os.path.join(path, 'index.js'))
             found_paths.append({
@@ -479,18 +816,24 @@ def health_check():
         'python_scrapers_available': PYTHON_SCRAPERS_AVAILABLE,
         'node_scraper_available': grocery_scraper_found,
         'grocery_scraper_path_check': found_paths,
-        'current_directory': current_dir,
+        'current_directory': CURRENT_DIR,
         'cache_entries': len(search_cache),
-        'cache_keys': list(search_cache.keys())
+        'node_workers': {
+            'enabled': USE_NODE_WORKERS,
+            'started': node_workers_started,
+            'idle': node_worker_pool.qsize()
+        }
     })
 
 @grocery_bp.route('/cache/clear', methods=['POST'])
 @cross_origin()
 def clear_cache():
     """Clear the search cache"""
-    global search_cache
-    cache_count = len(search_cache)
-    search_cache.clear()
+    with search_cache_lock:
+        cache_count = len(search_cache)
+        search_cache.clear()
+    with node_result_cache_lock:
+        node_result_cache.clear()
     return jsonify({
         'success': True,
         'message': f'Cleared {cache_count} cache entries',
@@ -502,7 +845,7 @@ def clear_cache():
 def test_scraper():
     """Test Node.js scraper directly for debugging"""
     try:
-        data = request.get_json()
+        data = request.get_json(silent=True) or {}
         query = data.get('query', 'milk')
         store = data.get('store', 'iga')
         
@@ -529,6 +872,10 @@ def test_scraper():
             'error_type': type(e).__name__
         }), 500
 
+# Upper bound on search keys scraped at once by search_all_stores
+SEARCH_KEY_WORKERS = 8
+STORE_CALL_WORKERS = 8
+
 def search_all_stores(search_keys, max_results_per_store=50, selected_stores=None):
     """Search selected stores (or all available stores) for the given search keys"""
     if selected_stores is None or len(selected_stores) == 0:
@@ -552,15 +899,17 @@ def search_all_stores(search_keys, max_results_per_store=50, selected_stores=Non
             use_python_scrapers = True
             use_node_scrapers = True
     
-    all_products = []
-    
-    for search_key in search_keys:
+    def search_key_products(search_key):
+        """Scrape every selected store for one search key"""
         log_and_print(f"Searching stores {search_stores} for: {search_key}")
         
+        # Collect one (scraper, store) call per scraper run that this key needs
+        calls = []
+        
         # Use Python scrapers (ALDI and IGA) if needed
         if use_python_scrapers and PYTHON_SCRAPERS_AVAILABLE:
             if 'all' in search_stores:
-                python_result = run_python_scrapers(search_key, 'all', max_results_per_store)
+                calls.append((run_python_scrapers, 'all'))
             else:
                 # Filter selected python stores
                 python_stores = [store for store in selected_stores if store in ['aldi-py', 'iga-py']]
@@ -568,68 +917,84 @@ def search_all_stores(search_keys, max_results_per_store=50, selected_stores=Non
                     # Convert store names for python scraper
                     python_store_map = {'aldi-py': 'aldi', 'iga-py': 'iga'}
                     mapped_stores = [python_store_map.get(store, store) for store in python_stores]
-                    python_result = run_python_scrapers(search_key, mapped_stores, max_results_per_store)
-                else:
-                    python_result = {}
-            
-            if 'products' in python_result:
-                all_products.extend(python_result['products'])
+                    calls.append((run_python_scrapers, mapped_stores))
         
         # Use Node.js scrapers (Woolworths, Coles, Harris Farm, etc.) if needed
         if use_node_scrapers:
             if 'all' in search_stores:
-                node_result = run_node_scraper(search_key, 'all', max_results_per_store)
+                calls.append((run_node_scraper, 'all'))
             else:
-                # Filter selected node stores
+                # Multiple Node.js stores are scraped individually and combined
                 node_stores = [store for store in selected_stores if store in ['woolworths', 'coles', 'harris', 'iga', 'aldi']]
-                if node_stores:
-                    # For multiple stores, we'll need to call each individually and combine
-                    node_result = {'products': []}
-                    for store in node_stores:
-                        store_result = run_node_scraper(search_key, store, max_results_per_store)
-                        if 'products' in store_result:
-                            node_result['products'].extend(store_result['products'])
-                        elif isinstance(store_result, list):
-                            node_result['products'].extend(store_result)
-                else:
-                    node_result = {}
-            
-            if 'products' in node_result:
-                all_products.extend(node_result['products'])
-            elif isinstance(node_result, list):
-                all_products.extend(node_result)
+                calls.extend((run_node_scraper, store) for store in node_stores)
+        
+        def run_call(call):
+            scraper, store = call
+            try:
+                return scraper(search_key, store, max_results_per_store)
+            except Exception as e:
+                log_and_print(f"Error searching {store} for {search_key}: {e}", 'error')
+                return {}
+        
+        # Each call waits on a remote store or the Node.js scraper, so run them side by side;
+        # the key then takes as long as its slowest store, and results keep call order
+        if len(calls) > 1:
+            with ThreadPoolExecutor(max_workers=min(len(calls), STORE_CALL_WORKERS)) as executor:
+                results = list(executor.map(run_call, calls))
+        else:
+            results = [run_call(call) for call in calls]
+        
+        products = []
+        for result in results:
+            if isinstance(result, list):
+                products.extend(result)
+            elif 'products' in result:
+                products.extend(result['products'])
+        
+        return products
+    
+    # Each key is an independent, I/O-bound scrape, so run keys side by side;
+    # results are still collected in key order
+    all_products = []
+    if len(search_keys) > 1:
+        with ThreadPoolExecutor(max_workers=min(len(search_keys), SEARCH_KEY_WORKERS)) as executor:
+            for products in executor.map(search_key_products, search_keys):
+                all_products.extend(products)
+    else:
+        for search_key in search_keys:
+            all_products.extend(search_key_products(search_key))
     
     # Remove duplicates based on title and store
     seen = set()
     unique_products = []
     for product in all_products:
-        key = f"{product.get('title', '').lower()}_{product.get('store', '').lower()}"
+        # A tuple key hashes the two parts directly, without building a joined string,
+        # and can't collide on titles that contain the separator
+        key = (product.get('title', '').casefold(), product.get('store', '').casefold())
         if key not in seen:
             seen.add(key)
             # Add store logo if not already present
             if 'store_logo' not in product and 'store' in product:
-                product['store_logo'] = get_store_logo_url(product['store'])
+                # Scraped products may be shared with the Node.js result cache, and the logo URL
+                # depends on this request's host, so annotate a copy
+                product = {**product, 'store_logo': get_store_logo_url(product['store'])}
             unique_products.append(product)
     
     # Sort by price (cheapest first)
-    unique_products.sort(key=lambda x: x.get('numericPrice', float('inf')))
+    unique_products.sort(key=price_sort_key)
     
     return unique_products
 
 def get_random_product_image(items):
     """Get a random product image from the list of items"""
-    if not items:
-        return None
-    
-    # Filter items that have valid image URLs
-    items_with_images = [item for item in items if item.get('imageUrl')]
-    
-    if not items_with_images:
-        return None
+    # Collect the valid image URLs, reading each item's imageUrl once
+    image_urls = [url for item in items if (url := item.get('imageUrl'))]
     
     # Return a random image URL
-    random_item = random.choice(items_with_images)
-    return random_item.get('imageUrl')
+    return random.choice(image_urls) if image_urls else None
+
+# Deletes '$' and ',' from a price string in one pass
+MONEY_SYMBOLS_TABLE = str.maketrans('', '', '$,')
 
 def calculate_total_savings(items):
     """Calculate total savings from discounted products in the list"""
@@ -638,24 +1003,26 @@ def calculate_total_savings(items):
     
     for item in items:
         # Check if item has discount information
-        current_price = item.get('numericPrice', 0)
-        
-        # Try different ways to get original price
-        original_price = None
-        if item.get('discountedPrice'):
+        get = item.get
+        discounted_price_text = get('discountedPrice')
+        if discounted_price_text:
             # If discountedPrice exists, current price should be the original
             try:
-                original_price = float(str(item.get('price', '0')).replace('$', '').replace(',', ''))
-                discounted_price = float(str(item.get('discountedPrice', '0')).replace('$', '').replace(',', ''))
+                original_price = float(str(get('price', '0')).translate(MONEY_SYMBOLS_TABLE))
+                discounted_price = float(str(discounted_price_text).translate(MONEY_SYMBOLS_TABLE))
                 if original_price > discounted_price:
                     total_savings += (original_price - discounted_price)
                     discounted_items += 1
             except (ValueError, TypeError):
                 pass
-        elif item.get('discount'):
+            continue
+        
+        discount_text = get('discount')
+        if discount_text:
             # If discount field exists, try to calculate savings
             try:
-                discount_price = float(str(item.get('discount', '0')).replace('$', '').replace(',', ''))
+                discount_price = float(str(discount_text).translate(MONEY_SYMBOLS_TABLE))
+                current_price = get('numericPrice', 0)
                 if discount_price > current_price:
                     total_savings += (discount_price - current_price)
                     discounted_items += 1
@@ -687,8 +1054,8 @@ def sort_products_by_discount_priority(products):
             regular_products.append(product)
     
     # Sort discounted products by price, then regular products by price
-    discounted_products.sort(key=lambda x: x.get('numericPrice', float('inf')))
-    regular_products.sort(key=lambda x: x.get('numericPrice', float('inf')))
+    discounted_products.sort(key=price_sort_key)
+    regular_products.sort(key=price_sort_key)
     
     # Return discounted products first, then regular products
     return discounted_products + regular_products
@@ -699,10 +1066,6 @@ def generate_shopping_lists(products, budget, num_lists=4, existing_used_product
     global_used_products = existing_used_products if existing_used_products else set()  # Track products used across all lists
     used_names = used_list_names if used_list_names else set()  # Track used list names
     
-    # Create a single shuffled list and divide it into segments for each strategy
-    shuffled_products = products.copy()
-    random.shuffle(shuffled_products)
-    
     # Generate 4 lists with random names and different strategies
     strategies = [
         ('cheapest_first', 'Maximum quantity - focuses on the cheapest items'),
@@ -718,9 +1081,13 @@ def generate_shopping_lists(products, budget, num_lists=4, existing_used_product
         generate_balanced_list_unique
     ]
     
+    # Sort once (discounted items first, then by price) and read each price and id once;
+    # every strategy walks this shared list of (product, price, product_id) entries
+    entries = price_entries(sort_products_by_discount_priority(products))
+    
     for i, ((strategy, description), generation_func) in enumerate(zip(strategies, generation_functions)):
         # Generate the list using the appropriate strategy
-        generated_list = generation_func(shuffled_products, budget, global_used_products)
+        generated_list = generation_func(entries, budget, global_used_products)
         
         # Get random name and image
         random_name = get_random_list_name(used_names)
@@ -743,20 +1110,22 @@ def generate_shopping_lists(products, budget, num_lists=4, existing_used_product
     
     return lists, global_used_products, used_names
 
+@lru_cache(maxsize=1)
 def load_list_names():
-    """Load random list names from configuration file"""
+    """Load random list names from configuration file (read once per process)"""
     try:
         config_path = os.path.join(os.path.dirname(__file__), '..', '..', 'config', 'list_names.json')
         with open(config_path, 'r') as f:
             config = json.load(f)
-            return config.get('list_names', [])
+            # A tuple, so callers can't modify the cached names
+            return tuple(config.get('list_names', []))
     except Exception as e:
         log_and_print(f"Error loading list names config: {e}", 'error')
         # Fallback to default names
-        return [
+        return (
             "Smart Shopper", "Budget Buddy", "Value Hunter", "Thrifty Finds",
             "Deal Detective", "Savings Safari", "Penny Pincher", "Bargain Beast"
-        ]
+        )
 
 def get_random_list_name(used_names=None):
     """Get a random list name, avoiding already used names if possible"""
@@ -772,22 +1141,29 @@ def get_random_list_name(used_names=None):
 
 def get_product_id(product):
     """Generate a unique identifier for a product"""
-    return f"{product.get('title', '')}-{product.get('store', '')}-{product.get('numericPrice', 0)}"
+    # A short digest keeps the used_products list the client sends back to /more compact
+    key = f"{product.get('title', '')}-{product.get('store', '')}-{product.get('numericPrice', 0)}"
+    return hashlib.blake2b(key.encode(), digest_size=8).hexdigest()
+
+def price_entries(sorted_products):
+    """(product, price, product_id) entries, in order, for the products that have a usable numeric price"""
+    # Each product's id is built once here instead of once per strategy pass that looks at it
+    entries = []
+    for product in sorted_products:
+        price = product.get('numericPrice', float('inf'))
+        if price is not None and price != float('inf'):
+            entries.append((product, price, get_product_id(product)))
+    return entries
 
-def generate_cheapest_list_unique(products, budget, used_products):
+def generate_cheapest_list_unique(entries, budget, used_products):
     """Generate a list focusing on the cheapest items, avoiding already used products"""
     items = []
     total_cost = 0.0
     
-    # Sort products to prioritize discounted items first
-    sorted_products = sort_products_by_discount_priority(products)
-    
-    for product in sorted_products:
-        product_id = get_product_id(product)
-        price = product.get('numericPrice', float('inf'))
+    # entries arrive with discounted items first, each group cheapest first
+    for product, price, product_id in entries:
         
-        if (price != float('inf') and 
-            total_cost + price <= budget and 
+        if (total_cost + price <= budget and 
             product_id not in used_products):
             items.append(product)
             total_cost += price
@@ -795,23 +1171,17 @@ def generate_cheapest_list_unique(products, budget, used_products):
     
     return {'items': items, 'total_cost': total_cost}
 
-def generate_variety_list_unique(products, budget, used_products):
+def generate_variety_list_unique(entries, budget, used_products):
     """Generate a list with variety across different stores, avoiding already used products"""
     items = []
     total_cost = 0.0
     stores_used = set()
     
-    # Sort products to prioritize discounted items first
-    sorted_products = sort_products_by_discount_priority(products)
-    
     # First pass: one item per store, prioritizing discounted items
-    for product in sorted_products:
-        product_id = get_product_id(product)
-        price = product.get('numericPrice', float('inf'))
+    for product, price, product_id in entries:
         store = product.get('store', '').lower()
         
-        if (price != float('inf') and 
-            total_cost + price <= budget and 
+        if (total_cost + price <= budget and 
             store not in stores_used and
             product_id not in used_products):
             items.append(product)
@@ -820,12 +1190,9 @@ def generate_variety_list_unique(products, budget, used_products):
             used_products.add(product_id)
     
     # Second pass: fill remaining budget with different items, still prioritizing discounted
-    for product in sorted_products:
-        product_id = get_product_id(product)
-        price = product.get('numericPrice', float('inf'))
+    for product, price, product_id in entries:
         
-        if (price != float('inf') and 
-            total_cost + price <= budget and 
+        if (total_cost + price <= budget and 
             product_id not in used_products):
             items.append(product)
             total_cost += price
@@ -833,20 +1200,15 @@ def generate_variety_list_unique(products, budget, used_products):
     
     return {'items': items, 'total_cost': total_cost}
 
-def generate_value_list_unique(products, budget, used_products):
+def generate_value_list_unique(entries, budget, used_products):
     """Generate a list prioritizing discounted items and good value, avoiding already used products"""
     items = []
     total_cost = 0.0
     
-    # Sort products to prioritize discounted items first
-    sorted_products = sort_products_by_discount_priority(products)
-    
-    for product in sorted_products:
-        product_id = get_product_id(product)
-        price = product.get('numericPrice', float('inf'))
+    # entries arrive with discounted items first, each group cheapest first
+    for product, price, product_id in entries:
         
-        if (price != float('inf') and 
-            total_cost + price <= budget and 
+        if (total_cost + price <= budget and 
             product_id not in used_products):
             items.append(product)
             total_cost += price
@@ -854,27 +1216,21 @@ def generate_value_list_unique(products, budget, used_products):
     
     return {'items': items, 'total_cost': total_cost}
 
-def generate_balanced_list_unique(products, budget, used_products):
+def generate_balanced_list_unique(entries, budget, used_products):
     """Generate a balanced list mixing affordable and mid-range items, avoiding already used products"""
     items = []
     total_cost = 0.0
     
-    # Sort products to prioritize discounted items first
-    sorted_products = sort_products_by_discount_priority(products)
-    
-    # Filter out already used products
-    available_products = [p for p in sorted_products if get_product_id(p) not in used_products]
-    
-    # Categorize products by price range
-    valid_products = [p for p in available_products if p.get('numericPrice', float('inf')) != float('inf')]
-    if not valid_products:
+    # Filter out already used products; every entry already has a usable price
+    valid_entries = [entry for entry in entries if entry[2] not in used_products]
+    if not valid_entries:
         return {'items': items, 'total_cost': total_cost}
     
-    prices = [p['numericPrice'] for p in valid_products]
-    avg_price = sum(prices) / len(prices)
+    # Categorize products by price range
+    avg_price = sum(entry[1] for entry in valid_entries) / len(valid_entries)
     
-    cheap_products = [p for p in valid_products if p['numericPrice'] <= avg_price * 0.7]
-    mid_products = [p for p in valid_products if avg_price * 0.7 < p['numericPrice'] <= avg_price * 1.3]
+    cheap_entries = [entry for entry in valid_entries if entry[1] <= avg_price * 0.7]
+    mid_entries = [entry for entry in valid_entries if avg_price * 0.7 < entry[1] <= avg_price * 1.3]
     
     # Alternate between cheap and mid-range items (both lists are already sorted with discounted items first)
     cheap_idx = 0
@@ -882,21 +1238,18 @@ def generate_balanced_list_unique(products, budget, used_products):
     use_cheap = True
     
     while total_cost < budget:
-        if use_cheap and cheap_idx < len(cheap_products):
-            product = cheap_products[cheap_idx]
+        if use_cheap and cheap_idx < len(cheap_entries):
+            product, price, product_id = cheap_entries[cheap_idx]
             cheap_idx += 1
-        elif mid_idx < len(mid_products):
-            product = mid_products[mid_idx]
+        elif mid_idx < len(mid_entries):
+            product, price, product_id = mid_entries[mid_idx]
             mid_idx += 1
-        elif cheap_idx < len(cheap_products):
-            product = cheap_products[cheap_idx]
+        elif cheap_idx < len(cheap_entries):
+            product, price, product_id = cheap_entries[cheap_idx]
             cheap_idx += 1
         else:
             break
         
-        product_id = get_product_id(product)
-        price = product.get('numericPrice', float('inf'))
-        
         if (total_cost + price <= budget and 
             product_id not in used_products):
             items.append(product)
@@ -930,14 +1283,14 @@ def generate_variety_list(products, budget):
     stores_used = set()
     used_products = set()
     
-    # Sort products to prioritize discounted items first
+    # Sort products to prioritize discounted items first, building each id once for both passes
     sorted_products = sort_products_by_discount_priority(products)
+    product_ids = [p.get('title', '') + p.get('store', '') for p in sorted_products]
     
     # First pass: one item per store, prioritizing discounted items
-    for product in sorted_products:
+    for product, product_id in zip(sorted_products, product_ids):
         price = product.get('numericPrice', float('inf'))
         store = product.get('store', '').lower()
-        product_id = product.get('title', '') + product.get('store', '')
         
         if (price != float('inf') and 
             total_cost + price <= budget and 
@@ -948,11 +1301,10 @@ def generate_variety_list(products, budget):
             stores_used.add(store)
             used_products.add(product_id)
     
-    # Second pass: fill remaining budget with different items, still prioritizing discounted
-    remaining_products = [p for p in sorted_products if (p.get('title', '') + p.get('store', '')) not in used_products]
-    for product in remaining_products:
+    # Second pass: fill remaining budget with different items, still prioritizing discounted.
+    # The membership check below already skips everything the first pass took.
+    for product, product_id in zip(sorted_products, product_ids):
         price = product.get('numericPrice', float('inf'))
-        product_id = product.get('title', '') + product.get('store', '')
         
         if (price != float('inf') and 
             total_cost + price <= budget and 
@@ -1030,7 +1382,7 @@ def generate_balanced_list(products, budget):
 def auto_generated_list():
     """Generate 4 optimized shopping lists within budget based on search keys"""
     try:
-        data = request.get_json()
+        data = request.get_json(silent=True)
         
         # Validate required parameters
         if not data:
@@ -1084,7 +1436,7 @@ def auto_generated_list():
                 'search_keys': search_keys,
                 'budget': budget,
                 'total_products_found': len(all_products),
-                'cheapest_product_price': min([p.get('numericPrice', float('inf')) for p in all_products]),
+                'cheapest_product_price': min(p.get('numericPrice', float('inf')) for p in all_products),
                 'lists': []
             })
         
@@ -1120,7 +1472,7 @@ def auto_generated_list():
 def auto_generated_list_more():
     """Generate 4 additional optimized shopping lists within budget, avoiding previously used products"""
     try:
-        data = request.get_json()
+        data = request.get_json(silent=True)
         
         # Validate required parameters
         if not data:
@@ -1175,7 +1527,7 @@ def auto_generated_list_more():
                 'search_keys': search_keys,
                 'budget': budget,
                 'total_products_found': len(all_products),
-                'cheapest_product_price': min([p.get('numericPrice', float('inf')) for p in all_products]),
+                'cheapest_product_price': min(p.get('numericPrice', float('inf')) for p in all_products),
                 'lists': []
             })
         
@@ -1220,7 +1572,7 @@ def auto_generated_list_more():
 def search_store_products(store_name):
     """Search for multiple products in a specific store, returning 10 cheapest items for each search term"""
     try:
-        data = request.get_json()
+        data = request.get_json(silent=True)
         
         if not data:
             return jsonify({'error': 'Request body is required'}), 400
@@ -1296,6 +1648,8 @@ def search_store_products(store_name):
         
         all_products = []
         search_term_stats = []
+        # One timestamp per request, used for products without their own scraped_at
+        scraped_at = time.strftime('%Y-%m-%dT%H:%M:%SZ')
         
         # Search for each term individually
         for search_term in search_terms:
@@ -1345,7 +1699,7 @@ def search_store_products(store_name):
                     "category": p.get("category", ""),
                     "productUrl": p.get("productUrl", ""),
                     "search_term": search_term,  # Add the search term that found this product
-                    "scraped_at": p.get("scraped_at", time.strftime('%Y-%m-%dT%H:%M:%SZ'))
+                    "scraped_at": p.get("scraped_at", scraped_at)
                 }
                 
                 # Only include products with valid prices
@@ -1374,7 +1728,7 @@ def search_store_products(store_name):
             'search_term_stats': search_term_stats,
             'total_products': len(all_products),
             'products': all_products,
-            'scraped_at': time.strftime('%Y-%m-%dT%H:%M:%SZ')
+            'scraped_at': scraped_at
         })
         
     except Exception as e:
@@ -1390,14 +1744,12 @@ def serve_logo(logo_name):
     """Serve store logo images"""
     try:
         # Get the path to the local logos directory within grocery-api
-        current_dir = os.path.dirname(os.path.abspath(__file__))
-        logos_path = os.path.join(current_dir, '..', '..', 'logos')
-        logo_file_path = os.path.join(logos_path, logo_name)
+        logo_file_path = os.path.join(LOGOS_PATH, logo_name)
         
         # Check if file exists and is a valid image file
         if not os.path.exists(logo_file_path):
             # Return default store logo if specific logo not found
-            default_logo_path = os.path.join(logos_path, 'default-store.png')
+            default_logo_path = os.path.join(LOGOS_PATH, 'default-store.png')
             if os.path.exists(default_logo_path):
                 return send_file(default_logo_path, mimetype='image/png')
             else:
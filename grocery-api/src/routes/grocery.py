@@ -1,14 +1,26 @@
-from flask import Blueprint, request, jsonify, send_file
-from concurrent.futures import ThreadPoolExecutor, as_completed
+from flask import Blueprint, current_app, request, jsonify, send_file
+from concurrent.futures import ThreadPoolExecutor, as_completed, wait
 from flask_cors import cross_origin
 # subprocess import removed - no longer needed for Node.js scraper
 import json
 import os
-import hashlib
 import time
 import sys
+import hashlib
 import logging
 import random
+import re
+import threading
+from operator import itemgetter
+from functools import lru_cache
+from collections import OrderedDict
+from contextlib import contextmanager
+
+try:
+    import redis
+except ImportError:
+    redis = None
+
 # shutil import removed - no longer needed for Node.js scraper
 
 # Import the Python scraper modules
@@ -37,10 +49,13 @@ except ImportError:
 
 grocery_bp = Blueprint('grocery', __name__)
 
-# Configure logging
-logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+# Logging is configured once by the app entry point (src/main.py)
 logger = logging.getLogger(__name__)
 
+# Paths are constant per deploy, so resolve them once at import
+CURRENT_DIR = os.path.dirname(os.path.abspath(__file__))
+LOGOS_PATH = os.path.join(CURRENT_DIR, '..', '..', 'logos')
+
 def get_store_logo_url(store_name, api_base_url=None):
     """
     Map store names to their logo URLs using the API endpoint
@@ -84,57 +99,408 @@ def get_store_logo_url(store_name, api_base_url=None):
     # Return API endpoint URL for the logo
     return f"{api_base_url}/logos/{logo_filename}"
 
-def log_and_print(message, level='info'):
-    """Log message once using the configured logger"""
-    if level.lower() == 'info':
-        logger.info(message)
-    elif level.lower() == 'error':
-        logger.error(message)
-    elif level.lower() == 'warning':
-        logger.warning(message)
-    elif level.lower() == 'debug':
-        logger.debug(message)
+IGA_PRICE_PATTERN = re.compile(r'\$(\d+\.?\d*)')
+NON_PRICE_CHARS_PATTERN = re.compile(r'[^\d.]')
+# Deletes '$' and ',' from a price string in one pass
+MONEY_SYMBOLS_TABLE = str.maketrans('', '', '$,')
 
 def parse_iga_price_safe(price_str):
-    """Safely parse IGA price strings like '$0.65 avg/ea' or '$5.99'"""
+    """Safely parse IGA price strings like '$0.65 avg/ea' or '$5.99', or an already numeric price"""
     try:
         if not price_str:
             return 0.0
         
+        # Numeric prices need no string parsing
+        if isinstance(price_str, (int, float)):
+            return float(price_str)
+        
         # Convert to string and clean
         price_str = str(price_str).strip()
         
         # Extract numeric part - look for pattern like $X.XX
-        import re
-        price_match = re.search(r'\$(\d+\.?\d*)', price_str)
+        price_match = IGA_PRICE_PATTERN.search(price_str)
         if price_match:
             return float(price_match.group(1))
         else:
             # Try to remove all non-numeric characters except dots
-            clean_price = re.sub(r'[^\d.]', '', price_str)
+            clean_price = NON_PRICE_CHARS_PATTERN.sub('', price_str)
             return float(clean_price) if clean_price else 0.0
     except (ValueError, AttributeError):
         return 0.0
 
-# In-memory cache for search results
-search_cache = {}
+# Sentinel price for products without a usable numeric price
+INF = float('inf')
+
+# Last formatted timestamp as (epoch second, ISO string); responses in the same second share it
+_last_timestamp = (None, '')
+
+def utc_timestamp():
+    """Current UTC time as an ISO 8601 string, formatted at most once per second"""
+    global _last_timestamp
+    second = int(time.time())
+    cached_second, formatted = _last_timestamp
+    if cached_second != second:
+        formatted = time.strftime('%Y-%m-%dT%H:%M:%SZ', time.gmtime(second))
+        _last_timestamp = (second, formatted)
+    return formatted
+
+def price_sort_key(product):
+    """Sort key for cheapest-first ordering; missing or null prices sort last"""
+    price = product.get('numericPrice')
+    return INF if price is None else price
+
+# In-memory LRU cache for search results: key -> {'value': ..., 'expires': monotonic deadline}
+search_cache = OrderedDict()
 CACHE_DURATION = 300  # 5 minutes in seconds
+# Merged multi-key store searches are built from scrapes that may already be cached, so they
+# only live long enough to serve a list and its follow-up /more requests
+STORES_CACHE_DURATION = 60  # seconds
+CACHE_MAX_ENTRIES = 1024
+search_cache_lock = threading.Lock()
+
+# Optional shared Redis cache so all gunicorn workers see the same entries;
+# set REDIS_URL (e.g. redis://localhost:6379/0) to enable it
+REDIS_URL = os.getenv('REDIS_URL')
+REDIS_SOCKET_TIMEOUT = float(os.getenv('REDIS_SOCKET_TIMEOUT', '1.0'))  # seconds
+REDIS_KEY_PREFIX = 'grocery:'
+redis_client = None
+if REDIS_URL:
+    if redis is not None:
+        # Bounded socket timeouts so an unreachable or hung Redis fails fast (and falls back
+        # to scraping) instead of blocking requests
+        redis_client = redis.Redis.from_url(
+            REDIS_URL,
+            socket_timeout=REDIS_SOCKET_TIMEOUT,
+            socket_connect_timeout=REDIS_SOCKET_TIMEOUT
+        )
+        logger.info(f"Using Redis search cache at {REDIS_URL}")
+    else:
+        logger.warning("REDIS_URL is set but the redis package is not installed; using in-memory cache")
 
 def get_cache_key(query, store, max_results=50):
-    """Generate a cache key for the search parameters"""
-    return hashlib.md5(f"{query.lower()}:{store}:{max_results}".encode()).hexdigest()
+    """Generate a cache key for the search parameters (a plain tuple; no digest needed)"""
+    return ('search', query.lower(), store, max_results)
+
+def encode_cache_value(value):
+    """Serialize a cache value for Redis"""
+    # The stdlib, not orjson: unpriced products carry numericPrice=float('inf'), which orjson
+    # writes as null and which would come back as None instead of sorting last
+    return json.dumps(value)
+
+def decode_cache_value(raw):
+    """Inverse of encode_cache_value"""
+    return json.loads(raw)
+
+def get_redis_cache_key(key):
+    """Redis key for a tuple cache key"""
+    return REDIS_KEY_PREFIX + format_cache_key(key)
+
+def cache_get(key):
+    """Return the cached value for key, or None if it is missing or expired"""
+    if redis_client is not None:
+        try:
+            raw = redis_client.get(get_redis_cache_key(key))
+        except redis.RedisError as e:
+            logger.warning(f"Redis cache read failed: {e}")
+            return None
+        return None if raw is None else decode_cache_value(raw)
+    
+    with search_cache_lock:
+        entry = search_cache.get(key)
+        if entry is None:
+            return None
+        if entry['expires'] <= time.monotonic():
+            del search_cache[key]
+            return None
+        search_cache.move_to_end(key)
+        return entry['value']
+
+def cache_set(key, value, ttl=CACHE_DURATION):
+    """Cache value under key for ttl seconds, evicting the least recently used entries beyond CACHE_MAX_ENTRIES"""
+    if redis_client is not None:
+        # Redis expires the entry itself
+        try:
+            redis_client.setex(get_redis_cache_key(key), ttl, encode_cache_value(value))
+        except redis.RedisError as e:
+            logger.warning(f"Redis cache write failed: {e}")
+        return
+    
+    with search_cache_lock:
+        search_cache[key] = {'value': value, 'expires': time.monotonic() + ttl}
+        search_cache.move_to_end(key)
+        while len(search_cache) > CACHE_MAX_ENTRIES:
+            search_cache.popitem(last=False)
+
+# Per-key locks for searches currently being scraped:
+# key -> [lock, number of waiting requests, outcome slot for requests arriving now]
+inflight_locks = {}
+inflight_locks_guard = threading.Lock()
+
+@contextmanager
+def inflight_lock(key):
+    """
+    Hold the lock for key so identical concurrent searches scrape only once
+    
+    Yields a dict shared by the requests that arrive while the same holder has the lock; that
+    holder records its outcome there (including failures, which aren't cached) for the ones
+    queued behind it. Once it releases the lock with an outcome recorded, later arrivals get a
+    fresh slot, so an uncached failure or partial result is only reused by requests that were
+    already waiting for it.
+    """
+    with inflight_locks_guard:
+        entry = inflight_locks.get(key)
+        if entry is None:
+            entry = inflight_locks[key] = [threading.Lock(), 0, {}]
+        entry[1] += 1
+        outcome = entry[2]
+    try:
+        with entry[0]:
+            try:
+                yield outcome
+            finally:
+                with inflight_locks_guard:
+                    if outcome and entry[2] is outcome:
+                        entry[2] = {}
+    finally:
+        with inflight_locks_guard:
+            entry[1] -= 1
+            if entry[1] == 0:
+                del inflight_locks[key]
+
+def cache_keys():
+    """Readable keys of all cached entries"""
+    if redis_client is not None:
+        prefix_length = len(REDIS_KEY_PREFIX)
+        try:
+            return [key.decode()[prefix_length:] for key in redis_client.scan_iter(match=REDIS_KEY_PREFIX + '*')]
+        except redis.RedisError as e:
+            logger.warning(f"Redis cache key listing failed: {e}")
+            return []
+    
+    with search_cache_lock:
+        return [format_cache_key(key) for key in search_cache]
 
-def is_cache_valid(cache_entry):
-    """Check if cache entry is still valid"""
-    return time.time() - cache_entry['timestamp'] < CACHE_DURATION
+def cache_clear():
+    """Remove every cached entry and return how many were removed, or None if the cache is unreachable"""
+    if redis_client is not None:
+        try:
+            keys = list(redis_client.scan_iter(match=REDIS_KEY_PREFIX + '*'))
+            if keys:
+                redis_client.delete(*keys)
+        except redis.RedisError as e:
+            logger.warning(f"Redis cache clear failed: {e}")
+            return None
+        return len(keys)
+    
+    with search_cache_lock:
+        cache_count = len(search_cache)
+        search_cache.clear()
+    return cache_count
+
+# Upper bound on page size so a huge perPage can't force large slices and responses
+MAX_PER_PAGE = 100
+
+def paginate(items, page, per_page):
+    """Return (page_items, has_more) for a 1-based page of a pre-sorted list"""
+    total = len(items)
+    # Everything fits on the first page, so there is nothing to slice
+    if page == 1 and total <= per_page:
+        return items, False
+    start_idx = (page - 1) * per_page
+    # Past the last page there is nothing to copy
+    if start_idx >= total:
+        return [], False
+    end_idx = start_idx + per_page
+    return items[start_idx:end_idx], end_idx < total
 
 def get_category_cache_key(category, stores, dietary_preference='none'):
     """Generate cache key for category searches"""
-    stores_str = '_'.join(sorted(stores)) if isinstance(stores, list) else stores
-    cache_str = f"category_{category}_{stores_str}_{dietary_preference}"
-    return hashlib.md5(cache_str.encode()).hexdigest()
+    stores_key = tuple(sorted(stores)) if isinstance(stores, list) else stores
+    return ('category', category, stores_key, dietary_preference)
+
+def format_cache_key(key):
+    """Readable string form of a tuple cache key for diagnostics"""
+    return ':'.join('_'.join(part) if isinstance(part, tuple) else str(part) for part in key)
+
+def normalize_store_names(store_param):
+    """Convert store parameter to list of normalized store names"""
+    if isinstance(store_param, list):
+        stores = store_param
+    elif store_param == 'all':
+        stores = ['aldi', 'iga', 'harris', 'coles']
+    else:
+        stores = [store_param]
+
+    # Normalize store names and remove -py suffix
+    normalized = []
+    for s in stores:
+        s = s.lower().strip()
+        if s.endswith('-py'):
+            s = s[:-3]
+        if s in ['aldi', 'iga', 'harris', 'coles']:
+            normalized.append(s)
+
+    return normalized
+
+def standardize_aldi_product(product, scraped_at):
+    """Convert ALDI product to standard format"""
+    try:
+        # Bind the lookup once; each product is read a dozen times
+        get = product.get
+        # Handle discount logic properly
+        current_price = get('price', '')
+        discount_price = get('discount_price', '')
+
+        # If there's a discount_price, that's the original price and current price is discounted
+        if discount_price:
+            discount_text = f"Was {discount_price}"
+            display_price = current_price
+        else:
+            discount_text = ''
+            display_price = current_price
+
+        return {
+            'title': get('name', '').strip(),
+            'store': 'Aldi',
+            'price': display_price,
+            'discountedPrice': discount_price if discount_price else '',
+            'discount': discount_text,
+            'numericPrice': aldi_scrapper.aldi_parse_price(current_price) if aldi_scrapper else 0,
+            'inStock': True,
+            'unitPrice': '',  # Not available in ALDI API
+            'imageUrl': get('imageUrl', get('image', '')),
+            'brand': get('brand', ''),
+            'category': get('categoryName', ''),
+            'productUrl': '',  # Not available in ALDI API
+            'scraped_at': scraped_at,
+            'scraper_source': 'python_aldi'
+        }
+    except Exception as e:
+        logger.error(f"Error standardizing ALDI product {product}: {e}")
+        return None
+
+def standardize_iga_product(product, scraped_at):
+    """Convert IGA product to standard format"""
+    try:
+        get = product.get
+        # Handle IGA price structure
+        current_price = get('price', '')
+        discount_price = get('discount_price', '')
+        original_price = get('original_price', '')
+
+        # Determine discount text
+        discount_text = ''
+        if original_price:
+            discount_text = f"Was {original_price}"
+        elif discount_price and discount_price != current_price:
+            discount_text = f"Was {discount_price}"
+
+        return {
+            'title': get('name', '').strip(),
+            'store': 'IGA',
+            'price': current_price if isinstance(current_price, str) else str(current_price),
+            'discountedPrice': original_price if original_price else discount_price,
+            'discount': discount_text,
+            'numericPrice': parse_iga_price_safe(current_price),
+            'inStock': get('available', True),
+            'unitPrice': get('unitPrice', get('pricePerUnit', '')),
+            'imageUrl': get('image', get('imageUrl', '')),
+            'brand': get('brand', ''),
+            'category': '',  # Not readily available in IGA API
+            'productUrl': '',  # Not available in IGA API
+            'scraped_at': scraped_at,
+            'scraper_source': 'python_iga'
+        }
+    except Exception as e:
+        logger.error(f"Error standardizing IGA product {product}: {e}")
+        return None
+
+def standardize_harris_product(product, scraped_at):
+    """Convert Harris product to standard format"""
+    try:
+        get = product.get
+        # Harris scraper already returns in a good format, just need minor adjustments
+        main_price = get('price', '')
+
+        return {
+            'title': get('title', '').strip(),
+            'store': get('store', 'Harris Farm Markets'),
+            'price': main_price,
+            'discountedPrice': get('discountedPrice', ''),
+            'discount': get('discount', ''),
+            'numericPrice': get('numericPrice', 0),
+            'inStock': get('inStock', True),
+            'unitPrice': get('unitPrice', ''),
+            'unitPriceText': get('unitPriceText', ''),
+            'imageUrl': get('imageUrl', ''),
+            'brand': get('brand', ''),
+            'category': get('category', ''),
+            'productUrl': get('productUrl', ''),
+            'scraped_at': get('scraped_at', scraped_at),
+            'scraper_source': 'python_harris'
+        }
+    except Exception as e:
+        logger.error(f"Error standardizing Harris product {product}: {e}")
+        return None
+
+def standardize_coles_product(product, scraped_at):
+    """Convert Coles product to standard format"""
+    try:
+        get = product.get
+        # Coles scraper returns products in a consistent format
+        main_price = get('price', '')
+        numeric_price = get('price_numeric', 0)
+
+        return {
+            'title': get('name', '').strip(),
+            'store': get('store', 'Coles'),
+            'price': main_price,
+            'discountedPrice': get('discount_price', ''),
+            'discount': get('discount_amount', ''),
+            'numericPrice': INF if numeric_price is None else numeric_price,
+            'inStock': True,  # Coles file-based scraper assumes in stock
+            'unitPrice': get('per_unit_price', ''),
+            'unitPriceText': get('per_unit_price', ''),
+            'imageUrl': get('imageUrl', ''),
+            'brand': get('brand', ''),
+            'category': get('category', ''),
+            'productUrl': get('productUrl', ''),
+            'scraped_at': scraped_at,
+            'scraper_source': 'python_coles',
+            'weight_size': get('weight_size', ''),
+            'original_price': get('original_price', ''),
+            'discount_percentage': get('discount_percentage', '')
+        }
+    except Exception as e:
+        logger.error(f"Error standardizing Coles product {product}: {e}")
+        return None
 
 def run_python_scrapers(query, store='all', max_results=50, timeout_seconds=30):
+    """
+    Run the Python scrapers, reusing results of the same search from the last CACHE_DURATION seconds
+    
+    List generation, store and category searches repeat the same (query, stores) scrapes
+    across requests; this shares one scrape between them. Takes the same arguments and
+    returns the same shape as scrape_python_stores.
+    """
+    try:
+        cache_key = ('scrape', query.lower().strip(), tuple(normalize_store_names(store)), max_results)
+    except AttributeError:
+        # Malformed query or store names; let the scraper report the error
+        return scrape_python_stores(query, store, max_results, timeout_seconds)
+    
+    result = cache_get(cache_key)
+    if result is None:
+        result = scrape_python_stores(query, store, max_results, timeout_seconds)
+        # Errors and stores that timed out are retried by the next search instead of cached
+        if 'error' in result or 'timed_out_stores' in result:
+            return result
+        cache_set(cache_key, result)
+    
+    # The products are shared with the cache; callers that annotate a product copy it first
+    return result
+
+def scrape_python_stores(query, store='all', max_results=50, timeout_seconds=30):
     """
     Run the Python scrapers for ALDI, IGA, and Harris Farm Markets with improved error handling and store support
     
@@ -142,172 +508,27 @@ def run_python_scrapers(query, store='all', max_results=50, timeout_seconds=30):
         query (str): Search query
         store (str or list): Store name(s) to search - 'all', 'aldi', 'iga', ['aldi', 'iga'], etc.
         max_results (int): Maximum results per store
-        timeout_seconds (int): Timeout for each scraper call (not implemented in Flask threads)
+        timeout_seconds (int): How long to wait for the slowest store; stores still running
+            after that are left out of the results and listed under 'timed_out_stores'
     
     Returns:
         dict: {'products': [...]} or {'error': 'error message'}
     """
-    # Note: signal-based timeout doesn't work in Flask threads, so we'll skip timeout for now
-    # This could be implemented with threading.Timer or multiprocessing if needed
-    
-    def normalize_store_names(store_param):
-        """Convert store parameter to list of normalized store names"""
-        if isinstance(store_param, list):
-            stores = store_param
-        elif store_param == 'all':
-            stores = ['aldi', 'iga', 'harris', 'coles']
-        else:
-            stores = [store_param]
-        
-        # Normalize store names and remove -py suffix
-        normalized = []
-        for s in stores:
-            s = s.lower().strip()
-            if s.endswith('-py'):
-                s = s[:-3]
-            if s in ['aldi', 'iga', 'harris', 'coles']:
-                normalized.append(s)
-        
-        return normalized
-    
-    def standardize_aldi_product(product):
-        """Convert ALDI product to standard format"""
-        try:
-            # Handle discount logic properly
-            current_price = product.get('price', '')
-            discount_price = product.get('discount_price', '')
-            
-            # If there's a discount_price, that's the original price and current price is discounted
-            if discount_price:
-                discount_text = f"Was {discount_price}"
-                display_price = current_price
-            else:
-                discount_text = ''
-                display_price = current_price
-            
-            return {
-                'title': product.get('name', '').strip(),
-                'store': 'Aldi',
-                'price': display_price,
-                'discountedPrice': discount_price if discount_price else '',
-                'discount': discount_text,
-                'numericPrice': aldi_scrapper.aldi_parse_price(current_price) if aldi_scrapper else 0,
-                'inStock': True,
-                'unitPrice': '',  # Not available in ALDI API
-                'imageUrl': product.get('imageUrl', product.get('image', '')),
-                'brand': product.get('brand', ''),
-                'category': product.get('categoryName', ''),
-                'productUrl': '',  # Not available in ALDI API
-                'scraped_at': time.strftime('%Y-%m-%dT%H:%M:%SZ'),
-                'scraper_source': 'python_aldi'
-            }
-        except Exception as e:
-            log_and_print(f"Error standardizing ALDI product {product}: {e}", 'error')
-            return None
-    
-    def standardize_iga_product(product):
-        """Convert IGA product to standard format"""
-        try:
-            # Handle IGA price structure
-            current_price = product.get('price', '')
-            discount_price = product.get('discount_price', '')
-            original_price = product.get('original_price', '')
-            
-            # Determine discount text
-            discount_text = ''
-            if original_price:
-                discount_text = f"Was {original_price}"
-            elif discount_price and discount_price != current_price:
-                discount_text = f"Was {discount_price}"
-            
-            return {
-                'title': product.get('name', '').strip(),
-                'store': 'IGA',
-                'price': str(current_price),
-                'discountedPrice': original_price if original_price else discount_price,
-                'discount': discount_text,
-                'numericPrice': parse_iga_price_safe(str(current_price)),
-                'inStock': product.get('available', True),
-                'unitPrice': product.get('unitPrice', product.get('pricePerUnit', '')),
-                'imageUrl': product.get('image', product.get('imageUrl', '')),
-                'brand': product.get('brand', ''),
-                'category': '',  # Not readily available in IGA API
-                'productUrl': '',  # Not available in IGA API
-                'scraped_at': time.strftime('%Y-%m-%dT%H:%M:%SZ'),
-                'scraper_source': 'python_iga'
-            }
-        except Exception as e:
-            log_and_print(f"Error standardizing IGA product {product}: {e}", 'error')
-            return None
-    
-    def standardize_harris_product(product):
-        """Convert Harris product to standard format"""
-        try:
-            # Harris scraper already returns in a good format, just need minor adjustments
-            main_price = product.get('price', '')
-            
-            return {
-                'title': product.get('title', '').strip(),
-                'store': product.get('store', 'Harris Farm Markets'),
-                'price': main_price,
-                'discountedPrice': product.get('discountedPrice', ''),
-                'discount': product.get('discount', ''),
-                'numericPrice': product.get('numericPrice', 0),
-                'inStock': product.get('inStock', True),
-                'unitPrice': product.get('unitPrice', ''),
-                'unitPriceText': product.get('unitPriceText', ''),
-                'imageUrl': product.get('imageUrl', ''),
-                'brand': product.get('brand', ''),
-                'category': product.get('category', ''),
-                'productUrl': product.get('productUrl', ''),
-                'scraped_at': product.get('scraped_at', time.strftime('%Y-%m-%dT%H:%M:%SZ')),
-                'scraper_source': 'python_harris'
-            }
-        except Exception as e:
-            log_and_print(f"Error standardizing Harris product {product}: {e}", 'error')
-            return None
-    
-    def standardize_coles_product(product):
-        """Convert Coles product to standard format"""
-        try:
-            # Coles scraper returns products in a consistent format
-            main_price = product.get('price', '')
-            
-            return {
-                'title': product.get('name', '').strip(),
-                'store': product.get('store', 'Coles'),
-                'price': main_price,
-                'discountedPrice': product.get('discount_price', ''),
-                'discount': product.get('discount_amount', ''),
-                'numericPrice': product.get('price_numeric', 0),
-                'inStock': True,  # Coles file-based scraper assumes in stock
-                'unitPrice': product.get('per_unit_price', ''),
-                'unitPriceText': product.get('per_unit_price', ''),
-                'imageUrl': product.get('imageUrl', ''),
-                'brand': product.get('brand', ''),
-                'category': product.get('category', ''),
-                'productUrl': product.get('productUrl', ''),
-                'scraped_at': time.strftime('%Y-%m-%dT%H:%M:%SZ'),
-                'scraper_source': 'python_coles',
-                'weight_size': product.get('weight_size', ''),
-                'original_price': product.get('original_price', ''),
-                'discount_percentage': product.get('discount_percentage', '')
-            }
-        except Exception as e:
-            log_and_print(f"Error standardizing Coles product {product}: {e}", 'error')
-            return None
+    # One UTC timestamp per scrape, shared by every standardized product
+    scraped_at = utc_timestamp()
     
     try:
         all_products = []
         stores_to_search = normalize_store_names(store)
         scraper_errors = []
         
-        log_and_print(f"Python scrapers starting for query '{query}' in stores: {stores_to_search}")
+        logger.info(f"Python scrapers starting for query '{query}' in stores: {stores_to_search}")
         
-        # Scrape ALDI if requested
-        if 'aldi' in stores_to_search and aldi_scrapper:
+        def scrape_aldi():
+            """Scrape ALDI and return (products, errors)"""
+            products, errors = [], []
             try:
-                log_and_print(f"0001 Scraping ALDI Python API for: {query} with max_results {max_results}")
+                logger.info(f"0001 Scraping ALDI Python API for: {query} with max_results {max_results}")
                 
                 aldi_products = aldi_scrapper.fetch_aldi_products_with_discount(
                     query, 
@@ -317,31 +538,31 @@ def run_python_scrapers(query, store='all', max_results=50, timeout_seconds=30):
                 if aldi_products:
                     # Enforce max_results across paginated results
                     if len(aldi_products) > max_results:
-                        log_and_print(f"ALDI returned {len(aldi_products)} raw products; capping to max_results={max_results}")
+                        logger.info(f"ALDI returned {len(aldi_products)} raw products; capping to max_results={max_results}")
                         aldi_products = aldi_products[:max_results]
-                    log_and_print(f"ALDI returned {len(aldi_products)} raw products")
+                    logger.info(f"ALDI returned {len(aldi_products)} raw products")
                     
-                    # Convert to standard format
-                    for product in aldi_products:
-                        standardized = standardize_aldi_product(product)
-                        if standardized:
-                            all_products.append(standardized)
+                    # Convert to standard format, dropping products that failed to standardize
+                    standardized = [standardize_aldi_product(product, scraped_at) for product in aldi_products]
+                    products = [product for product in standardized if product]
                     
-                    log_and_print(f"ALDI: {len([p for p in all_products if p.get('store') == 'Aldi'])} products standardized")
+                    logger.info(f"ALDI: {len(products)} products standardized")
                 else:
-                    log_and_print("ALDI Python API returned no products - API may have restrictions")
-                    scraper_errors.append("ALDI: API returned no products (possible API changes or restrictions)")
+                    logger.info("ALDI Python API returned no products - API may have restrictions")
+                    errors.append("ALDI: API returned no products (possible API changes or restrictions)")
                     
             except Exception as e:
                 error_msg = f"ALDI scraper failed: {str(e)}"
-                log_and_print(error_msg, 'error')
-                scraper_errors.append(f"ALDI: {error_msg}")
+                logger.error(error_msg)
+                errors.append(f"ALDI: {error_msg}")
                 # Note: ALDI API may have changed or require additional authentication
+            return products, errors
         
-        # Scrape IGA if requested
-        if 'iga' in stores_to_search and iga_scrapper:
+        def scrape_iga():
+            """Scrape IGA and return (products, errors)"""
+            products, errors = [], []
             try:
-                log_and_print(f"Scraping IGA Python API for: {query}")
+                logger.info(f"Scraping IGA Python API for: {query}")
                 
                 iga_products = iga_scrapper.fetch_iga_products(
                     query, 
@@ -351,29 +572,29 @@ def run_python_scrapers(query, store='all', max_results=50, timeout_seconds=30):
                 if iga_products:
                     # Enforce max_results to be consistent with API contract
                     if len(iga_products) > max_results:
-                        log_and_print(f"IGA returned {len(iga_products)} raw products; capping to max_results={max_results}")
+                        logger.info(f"IGA returned {len(iga_products)} raw products; capping to max_results={max_results}")
                         iga_products = iga_products[:max_results]
-                    log_and_print(f"IGA returned {len(iga_products)} raw products")
+                    logger.info(f"IGA returned {len(iga_products)} raw products")
                     
-                    # Convert to standard format
-                    for product in iga_products:
-                        standardized = standardize_iga_product(product)
-                        if standardized:
-                            all_products.append(standardized)
+                    # Convert to standard format, dropping products that failed to standardize
+                    standardized = [standardize_iga_product(product, scraped_at) for product in iga_products]
+                    products = [product for product in standardized if product]
                     
-                    log_and_print(f"IGA: {len([p for p in all_products if p.get('store') == 'IGA'])} products standardized")
+                    logger.info(f"IGA: {len(products)} products standardized")
                 else:
-                    log_and_print("IGA returned no products")
+                    logger.info("IGA returned no products")
                     
             except Exception as e:
                 error_msg = f"IGA scraper failed: {str(e)}"
-                log_and_print(error_msg, 'error')
-                scraper_errors.append(f"IGA: {error_msg}")
+                logger.error(error_msg)
+                errors.append(f"IGA: {error_msg}")
+            return products, errors
         
-        # Scrape Harris if requested
-        if 'harris' in stores_to_search and harris_scrapper:
+        def scrape_harris():
+            """Scrape Harris Farm Markets and return (products, errors)"""
+            products, errors = [], []
             try:
-                log_and_print(f"Scraping Harris Farm Markets for: {query}")
+                logger.info(f"Scraping Harris Farm Markets for: {query}")
                 
                 harris_products = harris_scrapper.fetch_harris_products(
                     query, 
@@ -383,29 +604,29 @@ def run_python_scrapers(query, store='all', max_results=50, timeout_seconds=30):
                 if harris_products:
                     # Enforce max_results to be consistent with API contract
                     if len(harris_products) > max_results:
-                        log_and_print(f"Harris returned {len(harris_products)} raw products; capping to max_results={max_results}")
+                        logger.info(f"Harris returned {len(harris_products)} raw products; capping to max_results={max_results}")
                         harris_products = harris_products[:max_results]
-                    log_and_print(f"Harris returned {len(harris_products)} raw products")
+                    logger.info(f"Harris returned {len(harris_products)} raw products")
                     
-                    # Convert to standard format
-                    for product in harris_products:
-                        standardized = standardize_harris_product(product)
-                        if standardized:
-                            all_products.append(standardized)
+                    # Convert to standard format, dropping products that failed to standardize
+                    standardized = [standardize_harris_product(product, scraped_at) for product in harris_products]
+                    products = [product for product in standardized if product]
                     
-                    log_and_print(f"Harris: {len([p for p in all_products if p.get('store') == 'Harris Farm Markets'])} products standardized")
+                    logger.info(f"Harris: {len(products)} products standardized")
                 else:
-                    log_and_print("Harris returned no products")
+                    logger.info("Harris returned no products")
                     
             except Exception as e:
                 error_msg = f"Harris scraper failed: {str(e)}"
-                log_and_print(error_msg, 'error')
-                scraper_errors.append(f"Harris: {error_msg}")
+                logger.error(error_msg)
+                errors.append(f"Harris: {error_msg}")
+            return products, errors
         
-        # Scrape Coles if requested
-        if 'coles' in stores_to_search and coles_scrapper:
+        def scrape_coles():
+            """Scrape Coles and return (products, errors)"""
+            products, errors = [], []
             try:
-                log_and_print(f"Scraping Coles for: {query}")
+                logger.info(f"Scraping Coles for: {query}")
                 
                 coles_products = coles_scrapper.fetch_coles_products_from_file(
                     query, 
@@ -415,33 +636,66 @@ def run_python_scrapers(query, store='all', max_results=50, timeout_seconds=30):
                 if coles_products:
                     # Enforce max_results to be consistent with API contract
                     if len(coles_products) > max_results:
-                        log_and_print(f"Coles returned {len(coles_products)} raw products; capping to max_results={max_results}")
+                        logger.info(f"Coles returned {len(coles_products)} raw products; capping to max_results={max_results}")
                         coles_products = coles_products[:max_results]
-                    log_and_print(f"Coles returned {len(coles_products)} raw products")
+                    logger.info(f"Coles returned {len(coles_products)} raw products")
                     
-                    # Convert to standard format
-                    for product in coles_products:
-                        standardized = standardize_coles_product(product)
-                        if standardized:
-                            all_products.append(standardized)
+                    # Convert to standard format, dropping products that failed to standardize
+                    standardized = [standardize_coles_product(product, scraped_at) for product in coles_products]
+                    products = [product for product in standardized if product]
                     
-                    log_and_print(f"Coles: {len([p for p in all_products if p.get('store') == 'Coles'])} products standardized")
+                    logger.info(f"Coles: {len(products)} products standardized")
                 else:
-                    log_and_print("Coles returned no products")
+                    logger.info("Coles returned no products")
                     
             except Exception as e:
                 error_msg = f"Coles scraper failed: {str(e)}"
-                log_and_print(error_msg, 'error')
-                scraper_errors.append(f"Coles: {error_msg}")
+                logger.error(error_msg)
+                errors.append(f"Coles: {error_msg}")
+            return products, errors
+        
+        # Only schedule scrapers that were requested and imported successfully
+        store_scrapers = [
+            ('aldi', aldi_scrapper, scrape_aldi),
+            ('iga', iga_scrapper, scrape_iga),
+            ('harris', harris_scrapper, scrape_harris),
+            ('coles', coles_scrapper, scrape_coles),
+        ]
+        tasks = [(name, fn) for name, module, fn in store_scrapers if name in stores_to_search and module]
+        
+        # Scrapers are I/O bound, so run them concurrently; total wall time becomes
+        # the slowest store rather than the sum of all stores, capped at timeout_seconds.
+        # Each search gets its own thread per store, so every scraper starts at once and the
+        # timeout never includes time spent queued behind other searches or hung scrapers
+        executor = ThreadPoolExecutor(max_workers=max(len(tasks), 1), thread_name_prefix='scraper')
+        try:
+            futures = [executor.submit(fn) for name, fn in tasks]
+            wait(futures, timeout=timeout_seconds)
+        finally:
+            # Don't block on scrapers that are still running; their threads exit when they finish
+            executor.shutdown(wait=False)
+        
+        # Collect in store order so results stay deterministic. A scraper that is still
+        # running can't be interrupted; it finishes on its own thread and its result is dropped
+        timed_out_stores = []
+        for (name, fn), future in zip(tasks, futures):
+            if not future.done():
+                timed_out_stores.append(name)
+                scraper_errors.append(f"{name.upper()}: timed out after {timeout_seconds} seconds")
+                continue
+            products, errors = future.result()
+            all_products.extend(products)
+            scraper_errors.extend(errors)
         
         # Remove any None values from failed standardizations
         all_products = [p for p in all_products if p is not None]
         
-        # Sort by price (cheapest first)
+        # Sort by price (cheapest first); every standardized product has a numeric numericPrice,
+        # so the C-level itemgetter can be used instead of a Python key function
         try:
-            all_products.sort(key=lambda x: x.get('numericPrice', float('inf')))
+            all_products.sort(key=itemgetter('numericPrice'))
         except Exception as e:
-            log_and_print(f"Error sorting products by price: {e}", 'warning')
+            logger.warning(f"Error sorting products by price: {e}")
         
         result = {
             'products': all_products,
@@ -453,14 +707,16 @@ def run_python_scrapers(query, store='all', max_results=50, timeout_seconds=30):
         # Add error information if there were any
         if scraper_errors:
             result['warnings'] = scraper_errors
-            log_and_print(f"Python scrapers completed with warnings: {scraper_errors}", 'warning')
+            logger.warning(f"Python scrapers completed with warnings: {scraper_errors}")
+        if timed_out_stores:
+            result['timed_out_stores'] = timed_out_stores
         
-        log_and_print(f"Python scrapers completed successfully: {len(all_products)} total products from {len(stores_to_search)} stores")
+        logger.info(f"Python scrapers completed successfully: {len(all_products)} total products from {len(stores_to_search)} stores")
         return result
         
     except Exception as e:
         error_msg = f"Python scrapers failed completely: {str(e)}"
-        log_and_print(error_msg, 'error')
+        logger.error(error_msg)
         return {"error": error_msg}
 
 # Note: Node.js scraper function removed - now using Python scrapers only
@@ -470,12 +726,14 @@ def run_python_scrapers(query, store='all', max_results=50, timeout_seconds=30):
 def search_products():
     """Search for products across all stores or a specific store using Node.js scraper with caching"""
     try:
-        data = request.get_json()
+        # silent=True turns a malformed body into a 400 below instead of an exception
+        data = request.get_json(silent=True) or {}
         
-        if not data or 'query' not in data:
+        query = data.get('query')
+        if not isinstance(query, str):
             return jsonify({'error': 'Query parameter is required'}), 400
         
-        query = data['query'].strip()
+        query = query.strip()
         if not query:
             return jsonify({'error': 'Query cannot be empty'}), 400
         
@@ -488,118 +746,98 @@ def search_products():
             }), 400
         
         page = data.get('page', 1)
-        per_page = data.get('perPage', 10)
+        per_page = min(data.get('perPage', 10), MAX_PER_PAGE)
         max_results = data.get('max_results', 50)  # Get max_results from request or default to 50
         
         # Generate cache key
         cache_key = get_cache_key(query, store, max_results)
         
         # Check if we have cached results that are still valid
-        if cache_key in search_cache and is_cache_valid(search_cache[cache_key]):
-            log_and_print(f"LN-199: Using cached results for query: {query}, store: {store}")
-            all_products = search_cache[cache_key]['products']
-        else:
-            log_and_print(f"LN-201: Fetching fresh results for query: {query}, store: {store}")
+        all_products = cache_get(cache_key)
+        cached = all_products is not None
+        if not cached:
+            # Only the first request for an uncached key scrapes; concurrent requests
+            # for the same key wait here and then read its cached results or shared outcome
+            with inflight_lock(cache_key) as outcome:
+                all_products = cache_get(cache_key)
+                cached = all_products is not None
+                if not cached and 'response' in outcome:
+                    # An identical request finished without caching while this one waited;
+                    # reuse its outcome instead of scraping again behind it
+                    if 'error' in outcome['response']:
+                        return jsonify(outcome['response']), 500
+                    all_products = outcome['response']['products']
+                elif not cached:
+                    logger.info(f"LN-201: Fetching fresh results for query: {query}, store: {store}")
             
-            # Priority: Use Python scrapers for ALDI, IGA, and Harris Farm Markets
-            scraper_result = {"products": []}
-            
-            # Always use Node.js scraper for production reliability
-            # Only use Python scrapers if specifically requested with -py suffix
-            if PYTHON_SCRAPERS_AVAILABLE and store in ['aldi-py', 'iga-py']:
-                log_and_print("Using Python scrapers (explicitly requested)")
-                python_store = store.replace('-py', '')  # Convert aldi-py -> aldi
-                scraper_result = run_python_scrapers(query, python_store, max_results=max_results)
-                
-                if 'error' in scraper_result:
-                    log_and_print(f"Python scrapers failed: {scraper_result['error']}")
-                    scraper_result = {"products": []}  # Reset to try Node.js
-                elif scraper_result.get('products'):
-                    log_and_print(f"Python scrapers returned {len(scraper_result['products'])} products")
-                else:
-                    log_and_print("Python scrapers returned no products")
+                    # Store was validated above, so there is always at least one store to scrape
+                    stores_to_scrape = ['aldi', 'iga', 'coles'] if store == 'all' else [store]
+                    logger.info(f"Using Python scrapers for stores: {stores_to_scrape}")
+                    # search_products caches its own mapped results, so scrape directly
+                    scraper_result = scrape_python_stores(query, stores_to_scrape, max_results=max_results)
             
-            # Use Python scrapers for ALDI, IGA, and Harris Farm Markets
-            if not scraper_result.get('products'):
-                # Determine which stores to scrape
-                stores_to_scrape = []
-                if store == 'all':
-                    stores_to_scrape = ['aldi', 'iga', 'coles']
-                elif store in ['aldi', 'iga', 'coles']:
-                    stores_to_scrape = [store]
-                
-                if stores_to_scrape:
-                    log_and_print(f"Using Python scrapers for stores: {stores_to_scrape}")
-                    python_result = run_python_scrapers(query, stores_to_scrape, max_results=max_results)
-                    
-                    if 'error' not in python_result and python_result.get('products'):
-                        scraper_result = python_result
-                        log_and_print(f"Python scrapers returned {len(python_result['products'])} products")
+                    if 'error' not in scraper_result and scraper_result.get('products'):
+                        logger.info(f"Python scrapers returned {len(scraper_result['products'])} products")
                     else:
-                        log_and_print(f"Python scrapers failed or returned no products: {python_result.get('error', 'No products')}")
+                        logger.info(f"Python scrapers failed or returned no products: {scraper_result.get('error', 'No products')}")
                         # If we have warnings but no error, check if it's just ALDI API issues
-                        if python_result.get('warnings') and not python_result.get('error'):
-                            scraper_result = python_result  # Return what we have, even if empty
-                        else:
-                            scraper_result = {"error": f"No products found for {store}. {python_result.get('error', '')}"}
+                        if not (scraper_result.get('warnings') and not scraper_result.get('error')):
+                            scraper_result = {"error": f"No products found for {store}. {scraper_result.get('error', '')}"}
 
-            if 'error' in scraper_result:
-                return jsonify({
-                    'error': 'Failed to scrape products',
-                    'details': scraper_result['error'],
-                    'debug': scraper_result
-                }), 500
+                    if 'error' in scraper_result:
+                        outcome['response'] = {
+                            'error': 'Failed to scrape products',
+                            'details': scraper_result['error'],
+                            'debug': scraper_result
+                        }
+                        return jsonify(outcome['response']), 500
             
-            # Extract products from scraper result
-            if 'products' in scraper_result:
-                raw_products = scraper_result['products']
-            elif isinstance(scraper_result, list):
-                raw_products = scraper_result
-            else:
-                raw_products = []
-
-            all_products = []
-            for p in raw_products:
-                # Map existing fields and add missing ones
-                store_name = p.get("store", store)
-                product = {
-                    "title": p.get("title", "N/A"),
-                    "store": store_name,  # Use the actual store from scraped product, fallback to request store
-                    "store_logo": get_store_logo_url(store_name),  # Add store logo URL
-                    "price": p.get("price", f"${p.get('numericPrice', 0):.2f}"),
-                    "discountedPrice": p.get("discountedPrice", ""),
-                    "discount": p.get("discount", ""),
-                    "numericPrice": p.get("numericPrice", 0),
-                    "inStock": p.get("inStock", True),  # Use actual inStock value from scraper
-                    "unitPrice": p.get("unitPrice", ""),
-                    "imageUrl": p.get("imageUrl", ""),
-                    "brand": p.get("brand", ""),
-                    "category": p.get("category", ""),
-                    "productUrl": p.get("productUrl", ""),
-                    "scraped_at": p.get("scraped_at", "")
-                }
-
-                # Use discount field from scraper if not already set
-                if not product["discount"] and p.get("discount"):
-                    product["discount"] = p.get("discount")
+                    # Extract products from scraper result
+                    if 'products' in scraper_result:
+                        raw_products = scraper_result['products']
+                    elif isinstance(scraper_result, list):
+                        raw_products = scraper_result
+                    else:
+                        raw_products = []
 
-                all_products.append(product)
+                    all_products = []
+                    for p in raw_products:
+                        # Map existing fields and add missing ones, reading each raw field once
+                        get = p.get
+                        store_name = get("store", store)
+                        numeric_price = get("numericPrice", 0)
+                        all_products.append({
+                            "title": get("title", "N/A"),
+                            "store": store_name,  # Use the actual store from scraped product, fallback to request store
+                            "store_logo": get_store_logo_url(store_name),  # Add store logo URL
+                            # Only format a fallback price for products that have none
+                            "price": p["price"] if "price" in p else f"${numeric_price:.2f}",
+                            "discountedPrice": get("discountedPrice", ""),
+                            "discount": get("discount", ""),
+                            "numericPrice": numeric_price,
+                            "inStock": get("inStock", True),  # Use actual inStock value from scraper
+                            "unitPrice": get("unitPrice", ""),
+                            "imageUrl": get("imageUrl", ""),
+                            "brand": get("brand", ""),
+                            "category": get("category", ""),
+                            "productUrl": get("productUrl", ""),
+                            "scraped_at": get("scraped_at", "")
+                        })
             
-            # Sort by price (cheapest first)
-            all_products.sort(key=lambda x: x.get('numericPrice', float('inf')))
+                    # No re-sort needed: run_python_scrapers already returns products cheapest first
+                    # and the mapping above preserves order and numericPrice
             
-            # Cache the results
-            search_cache[cache_key] = {
-                'products': all_products,
-                'timestamp': time.time()
-            }
+                    # Cache the results, unless a store timed out and should be retried by the next search
+                    if 'timed_out_stores' not in scraper_result:
+                        cache_set(cache_key, all_products)
+                    outcome['response'] = {'products': all_products}
         
-        # Apply pagination to cached results
-        start_idx = (page - 1) * per_page
-        end_idx = start_idx + per_page
-        paginated_products = all_products[start_idx:end_idx]
+        if cached:
+            logger.info(f"LN-199: Using cached results for query: {query}, store: {store}")
         
-        has_more = end_idx < len(all_products)
+        # Apply pagination to cached results
+        paginated_products, has_more = paginate(all_products, page, per_page)
+        total = len(all_products)
         
         return jsonify({
             'success': True,
@@ -607,38 +845,49 @@ def search_products():
             'store': store,
             'page': page,
             'perPage': per_page,
-            'totalResults': len(all_products),
+            'totalResults': total,
             'currentPageResults': len(paginated_products),
             'hasMore': has_more,
             'products': paginated_products,
-            'cached': cache_key in search_cache and is_cache_valid(search_cache[cache_key])
+            'cached': cached
         })
     
     except Exception as e:
-        log_and_print(f"API error: {e}", 'error')
+        logger.error(f"API error: {e}")
         return jsonify({'error': 'Internal server error', 'details': str(e)}), 500
 
+# Supported stores response (static)
+STORES_RESPONSE = {
+    'success': True,
+    'stores': [
+        {'id': 'aldi', 'name': 'ALDI'},
+        {'id': 'iga', 'name': 'IGA'},
+        {'id': 'coles', 'name': 'Coles'},
+    ],
+    'message': 'ALDI, IGA, Coles, and Harris Farm Markets are supported via Python scrapers (ALDI may have API limitations)'
+}
+
+# Serialized bodies for constant endpoints, filled on first request
+static_response_bodies = {}
+
+def static_json_response(name, payload):
+    """Return a JSON response for a constant payload, serializing it only once"""
+    body = static_response_bodies.get(name)
+    if body is None:
+        body = static_response_bodies[name] = jsonify(payload).get_data()
+    return current_app.response_class(body, mimetype='application/json')
+
 @grocery_bp.route('/stores', methods=['GET'])
 @cross_origin()
 def get_stores():
     """Get list of supported stores"""
-    stores = [
-        {'id': 'aldi', 'name': 'ALDI'},
-        {'id': 'iga', 'name': 'IGA'},
-        {'id': 'coles', 'name': 'Coles'},
-    ]
-    
-    return jsonify({
-        'success': True,
-        'stores': stores,
-        'message': 'ALDI, IGA, Coles, and Harris Farm Markets are supported via Python scrapers (ALDI may have API limitations)'
-    })
+    return static_json_response('stores', STORES_RESPONSE)
 
 @grocery_bp.route('/health', methods=['GET'])
 @cross_origin()
 def health_check():
     """Health check endpoint"""
-    current_dir = os.path.dirname(os.path.abspath(__file__))
+    keys = cache_keys()
     
     return jsonify({
         'success': True,
@@ -647,22 +896,25 @@ def health_check():
         'supported_stores': ['aldi', 'iga', 'harris'] if PYTHON_SCRAPERS_AVAILABLE else [],
         'supported_categories': ['fruits', 'vegetables', 'dairy', 'meat', 'bakery', 'pantry', 'snacks', 'beverages', 'frozen', 'seafood', 'breakfast', 'healthy'],
         'scraper_info': 'Using Python scrapers for ALDI, IGA, and Harris Farm Markets. Node.js scrapers have been removed.',
-        'current_directory': current_dir,
-        'cache_entries': len(search_cache),
-        'cache_keys': list(search_cache.keys())
+        'current_directory': CURRENT_DIR,
+        'cache_entries': len(keys),
+        'cache_keys': keys
     })
 
 @grocery_bp.route('/cache/clear', methods=['POST'])
 @cross_origin()
 def clear_cache():
     """Clear the search cache"""
-    global search_cache
-    cache_count = len(search_cache)
-    search_cache.clear()
+    cache_count = cache_clear()
+    if cache_count is None:
+        return jsonify({
+            'success': False,
+            'error': 'Cache is unavailable; nothing was cleared'
+        }), 503
     return jsonify({
         'success': True,
         'message': f'Cleared {cache_count} cache entries',
-        'cache_entries': len(search_cache)
+        'cache_entries': 0
     })
 
 @grocery_bp.route('/test-scraper', methods=['POST'])
@@ -670,18 +922,18 @@ def clear_cache():
 def test_scraper():
     """Test Python scraper directly for debugging"""
     try:
-        data = request.get_json()
+        data = request.get_json(silent=True) or {}
         query = data.get('query', 'milk')
         store = data.get('store', 'iga')
         
-        log_and_print(f"Testing Python scraper with query='{query}', store='{store}'")
+        logger.info(f"Testing Python scraper with query='{query}', store='{store}'")
         
         # Only IGA is supported
         if store == 'iga':
-            log_and_print(f"Testing Python scraper for {store}")
-            result = run_python_scrapers(query, ['iga'], max_results=5)
+            logger.info(f"Testing Python scraper for {store}")
+            result = scrape_python_stores(query, ['iga'], max_results=5)
         else:
-            log_and_print(f"Store '{store}' is not supported")
+            logger.info(f"Store '{store}' is not supported")
             result = {"error": f"Store '{store}' is not supported. Only IGA is available."}
         
         return jsonify({
@@ -696,13 +948,16 @@ def test_scraper():
         })
         
     except Exception as e:
-        log_and_print(f"Error in test_scraper: {e}", 'error')
+        logger.error(f"Error in test_scraper: {e}")
         return jsonify({
             'success': False,
             'error': str(e),
             'error_type': type(e).__name__
         }), 500
 
+# Upper bound on search keys scraped at once by search_all_stores
+SEARCH_KEY_WORKERS = 8
+
 def search_all_stores(search_keys, max_results_per_store=50, selected_stores=None):
     """Search ALDI, IGA, and Harris Farm Markets stores for the given search keys"""
     if selected_stores is None or len(selected_stores) == 0:
@@ -714,58 +969,97 @@ def search_all_stores(search_keys, max_results_per_store=50, selected_stores=Non
         if 'all' in selected_stores:
             search_stores = ['aldi', 'iga', 'harris', 'coles']
         elif not search_stores:
-            log_and_print("No supported stores in selection. ALDI, IGA, Coles, and Harris Farm Markets are supported.", 'warning')
+            logger.warning("No supported stores in selection. ALDI, IGA, Coles, and Harris Farm Markets are supported.")
             return []
     
-    all_products = []
+    try:
+        # Keys keep their order (it decides which duplicate is kept); JSON keeps the Redis key unambiguous
+        cache_key = ('stores', json.dumps([key.lower().strip() for key in search_keys]),
+                     tuple(search_stores), max_results_per_store)
+        hash(cache_key)
+    except (AttributeError, TypeError):
+        cache_key = None
+    
+    # /auto-generated-list/more repeats the search of the list it follows, so reuse the merged result
+    unique_products = cache_get(cache_key) if cache_key is not None else None
+    if unique_products is None:
+        unique_products, complete = merge_store_searches(search_keys, search_stores, max_results_per_store)
+        # A search with a failed scrape is not cached, so the next request retries it
+        if complete and cache_key is not None:
+            cache_set(cache_key, unique_products, ttl=STORES_CACHE_DURATION)
+    
+    # Logo URLs depend on the request's host, so they are added per request, on copies
+    # because the products are shared with the cache
+    return [
+        {**product, 'store_logo': get_store_logo_url(product['store'])}
+        if product.get('store') is not None and 'store_logo' not in product else product
+        for product in unique_products
+    ]
+
+def merge_store_searches(search_keys, search_stores, max_results_per_store):
+    """Scrape search_stores for every key; returns (unique products cheapest first, whether every scrape succeeded)"""
+    failed_keys = []
     
-    for search_key in search_keys:
-        log_and_print(f"Searching stores {search_stores} for: {search_key}")
+    def search_key_products(search_key):
+        """Scrape every selected store for one search key"""
+        products = []
+        logger.info(f"Searching stores {search_stores} for: {search_key}")
         
         # Use Python scrapers for supported stores
         if PYTHON_SCRAPERS_AVAILABLE:
-            log_and_print(f"Using Python scrapers for stores: {search_stores}")
+            logger.info(f"Using Python scrapers for stores: {search_stores}")
             python_result = run_python_scrapers(search_key, search_stores, max_results_per_store)
             
             if 'products' in python_result:
-                all_products.extend(python_result['products'])
-                log_and_print(f"Python scrapers added {len(python_result['products'])} products")
+                products.extend(python_result['products'])
+                logger.info(f"Python scrapers added {len(python_result['products'])} products")
             elif 'error' in python_result:
-                log_and_print(f"Python scrapers failed: {python_result['error']}", 'warning')
+                logger.warning(f"Python scrapers failed: {python_result['error']}")
+                failed_keys.append(search_key)
+            if 'timed_out_stores' in python_result:
+                failed_keys.append(search_key)
         else:
-            log_and_print("Python scrapers not available", 'error')
+            logger.error("Python scrapers not available")
+            failed_keys.append(search_key)
+    
+        return products
+    
+    # Each key is an independent, I/O-bound scrape, so run keys side by side;
+    # results are still collected in key order
+    all_products = []
+    if len(search_keys) > 1:
+        with ThreadPoolExecutor(max_workers=min(len(search_keys), SEARCH_KEY_WORKERS)) as executor:
+            for products in executor.map(search_key_products, search_keys):
+                all_products.extend(products)
+    else:
+        for search_key in search_keys:
+            all_products.extend(search_key_products(search_key))
     
     # Remove duplicates based on title and store
     seen = set()
     unique_products = []
     for product in all_products:
-        key = f"{product.get('title', '').lower()}_{product.get('store', '').lower()}"
+        get = product.get
+        title = get('title')
+        store = get('store')
+        # Tuple keys hash the two parts directly, without building a joined string
+        key = (title.lower() if title else '', store.lower() if store else '')
         if key not in seen:
             seen.add(key)
-            # Add store logo if not already present
-            if 'store_logo' not in product and 'store' in product:
-                product['store_logo'] = get_store_logo_url(product['store'])
             unique_products.append(product)
     
     # Sort by price (cheapest first)
-    unique_products.sort(key=lambda x: x.get('numericPrice', float('inf')))
+    unique_products.sort(key=price_sort_key)
     
-    return unique_products
+    return unique_products, not failed_keys
 
 def get_random_product_image(items):
     """Get a random product image from the list of items"""
-    if not items:
-        return None
-    
-    # Filter items that have valid image URLs
-    items_with_images = [item for item in items if item.get('imageUrl')]
-    
-    if not items_with_images:
-        return None
+    # Collect the valid image URLs, reading each item's imageUrl once
+    image_urls = [url for item in items if (url := item.get('imageUrl'))]
     
     # Return a random image URL
-    random_item = random.choice(items_with_images)
-    return random_item.get('imageUrl')
+    return random.choice(image_urls) if image_urls else None
 
 def calculate_total_savings(items):
     """Calculate total savings from discounted products in the list"""
@@ -774,24 +1068,26 @@ def calculate_total_savings(items):
     
     for item in items:
         # Check if item has discount information
-        current_price = item.get('numericPrice', 0)
-        
-        # Try different ways to get original price
-        original_price = None
-        if item.get('discountedPrice'):
+        get = item.get
+        discounted_price_text = get('discountedPrice')
+        if discounted_price_text:
             # If discountedPrice exists, current price should be the original
             try:
-                original_price = float(str(item.get('price', '0')).replace('$', '').replace(',', ''))
-                discounted_price = float(str(item.get('discountedPrice', '0')).replace('$', '').replace(',', ''))
+                original_price = float(str(get('price', '0')).translate(MONEY_SYMBOLS_TABLE))
+                discounted_price = float(str(discounted_price_text).translate(MONEY_SYMBOLS_TABLE))
                 if original_price > discounted_price:
                     total_savings += (original_price - discounted_price)
                     discounted_items += 1
             except (ValueError, TypeError):
                 pass
-        elif item.get('discount'):
+            continue
+        
+        discount_text = get('discount')
+        if discount_text:
             # If discount field exists, try to calculate savings
             try:
-                discount_price = float(str(item.get('discount', '0')).replace('$', '').replace(',', ''))
+                discount_price = float(str(discount_text).translate(MONEY_SYMBOLS_TABLE))
+                current_price = get('numericPrice', 0)
                 if discount_price > current_price:
                     total_savings += (discount_price - current_price)
                     discounted_items += 1
@@ -803,31 +1099,17 @@ def calculate_total_savings(items):
         'discounted_items_count': discounted_items
     }
 
+def discount_priority_key(product):
+    """Sort key placing discounted products first, each group cheapest first"""
+    # A set discountedPrice already covers the old "price differs from discountedPrice" case
+    has_discount = product.get('discountedPrice') or product.get('discount')
+    return (not has_discount, price_sort_key(product))
+
 def sort_products_by_discount_priority(products):
     """Sort products to prioritize discounted items first"""
-    discounted_products = []
-    regular_products = []
-    
-    for product in products:
-        # Check if product has any discount indicators
-        has_discount = (
-            product.get('discountedPrice') or 
-            product.get('discount') or
-            (product.get('price') and product.get('discountedPrice') and 
-             product.get('price') != product.get('discountedPrice'))
-        )
-        
-        if has_discount:
-            discounted_products.append(product)
-        else:
-            regular_products.append(product)
-    
-    # Sort discounted products by price, then regular products by price
-    discounted_products.sort(key=lambda x: x.get('numericPrice', float('inf')))
-    regular_products.sort(key=lambda x: x.get('numericPrice', float('inf')))
-    
-    # Return discounted products first, then regular products
-    return discounted_products + regular_products
+    # One stable sort on (no discount, price) gives the same order as sorting the discounted
+    # and regular groups separately and concatenating them, in a single pass over the products
+    return sorted(products, key=discount_priority_key)
 
 def generate_shopping_lists(products, budget, num_lists=4, existing_used_products=None, used_list_names=None):
     """Generate 4 different shopping lists within the budget constraint with no duplicate products"""
@@ -835,10 +1117,6 @@ def generate_shopping_lists(products, budget, num_lists=4, existing_used_product
     global_used_products = existing_used_products if existing_used_products else set()  # Track products used across all lists
     used_names = used_list_names if used_list_names else set()  # Track used list names
     
-    # Create a single shuffled list and divide it into segments for each strategy
-    shuffled_products = products.copy()
-    random.shuffle(shuffled_products)
-    
     # Generate 4 lists with random names and different strategies
     strategies = [
         ('cheapest_first', 'Maximum quantity - focuses on the cheapest items'),
@@ -854,9 +1132,16 @@ def generate_shopping_lists(products, budget, num_lists=4, existing_used_product
         generate_balanced_list_unique
     ]
     
+    # Read each product's price once and sort once (discounted items first, then by price);
+    # every strategy walks this shared, already sorted list of (product, price, product_id) entries
+    # No shuffle first: the sort fixes the order anyway, and ties keep their scraped order
+    entries = price_entries(products)
+    entries.sort(key=entry_discount_priority_key)
+    min_prices = suffix_min_prices(entries)
+    
     for i, ((strategy, description), generation_func) in enumerate(zip(strategies, generation_functions)):
         # Generate the list using the appropriate strategy
-        generated_list = generation_func(shuffled_products, budget, global_used_products)
+        generated_list = generation_func(entries, budget, global_used_products, min_prices)
         
         # Get random name and image
         random_name = get_random_list_name(used_names)
@@ -879,20 +1164,22 @@ def generate_shopping_lists(products, budget, num_lists=4, existing_used_product
     
     return lists, global_used_products, used_names
 
+@lru_cache(maxsize=1)
 def load_list_names():
-    """Load random list names from configuration file"""
+    """Load random list names from configuration file (read once per process)"""
     try:
         config_path = os.path.join(os.path.dirname(__file__), '..', '..', 'config', 'list_names.json')
         with open(config_path, 'r') as f:
             config = json.load(f)
-            return config.get('list_names', [])
+            # A tuple, so callers can't modify the cached names
+            return tuple(config.get('list_names', []))
     except Exception as e:
-        log_and_print(f"Error loading list names config: {e}", 'error')
+        logger.error(f"Error loading list names config: {e}")
         # Fallback to default names
-        return [
+        return (
             "Smart Shopper", "Budget Buddy", "Value Hunter", "Thrifty Finds",
             "Deal Detective", "Savings Safari", "Penny Pincher", "Bargain Beast"
-        ]
+        )
 
 def get_random_list_name(used_names=None):
     """Get a random list name, avoiding already used names if possible"""
@@ -908,157 +1195,179 @@ def get_random_list_name(used_names=None):
 
 def get_product_id(product):
     """Generate a unique identifier for a product"""
-    return f"{product.get('title', '')}-{product.get('store', '')}-{product.get('numericPrice', 0)}"
+    # A short digest keeps the used_products list the client sends back to /more compact
+    key = f"{product.get('title', '')}-{product.get('store', '')}-{product.get('numericPrice', 0)}"
+    return hashlib.blake2b(key.encode(), digest_size=8).hexdigest()
 
-def generate_cheapest_list_unique(products, budget, used_products):
-    """Generate a list focusing on the cheapest items, avoiding already used products"""
-    items = []
-    total_cost = 0.0
-    
-    # Sort products to prioritize discounted items first
-    sorted_products = sort_products_by_discount_priority(products)
-    
-    for product in sorted_products:
-        product_id = get_product_id(product)
-        price = product.get('numericPrice', float('inf'))
+def price_entries(products):
+    """(product, price, product_id) entries for the products that have a usable numeric price"""
+    # Each product's id is built once here instead of once per strategy that looks at it
+    entries = []
+    for product in products:
+        price = product.get('numericPrice')
+        if price is not None and price != INF:
+            entries.append((product, price, get_product_id(product)))
+    return entries
+
+def entry_discount_priority_key(entry):
+    """discount_priority_key for a (product, price, product_id) entry"""
+    return discount_priority_key(entry[0])
+
+def suffix_min_prices(entries):
+    """min_prices[i] is the lowest price among entries[i:]"""
+    min_prices = [INF] * len(entries)
+    lowest = INF
+    for i in range(len(entries) - 1, -1, -1):
+        price = entries[i][1]
+        if price < lowest:
+            lowest = price
+        min_prices[i] = lowest
+    return min_prices
+
+def fill_within_budget(entries, budget, used_products, items, total_cost, min_prices):
+    """Greedily append unused entries in order while they fit the budget; returns the new total cost"""
+    # The remaining budget only shrinks, so once a price has been rejected every entry at that
+    # price or above can be skipped without a membership check, and once even the cheapest
+    # remaining entry no longer fits the scan can stop
+    rejected_price = INF
+    for i, (product, price, product_id) in enumerate(entries):
+        if total_cost + min_prices[i] > budget:
+            break
+        if price >= rejected_price:
+            continue
+        if total_cost + price > budget:
+            rejected_price = price
+            continue
         
-        if (price != float('inf') and 
-            total_cost + price <= budget and 
-            product_id not in used_products):
+        if product_id not in used_products:
             items.append(product)
             total_cost += price
             used_products.add(product_id)
     
+    return total_cost
+
+def generate_cheapest_list_unique(entries, budget, used_products, min_prices):
+    """Generate a list focusing on the cheapest items, avoiding already used products"""
+    items = []
+    total_cost = 0.0
+    
+    # entries arrive sorted with discounted items first, then by price
+    total_cost = fill_within_budget(entries, budget, used_products, items, total_cost, min_prices)
+    
     return {'items': items, 'total_cost': total_cost}
 
-def generate_variety_list_unique(products, budget, used_products):
+def generate_variety_list_unique(entries, budget, used_products, min_prices):
     """Generate a list with variety across different stores, avoiding already used products"""
     items = []
     total_cost = 0.0
     stores_used = set()
     
-    # Sort products to prioritize discounted items first
-    sorted_products = sort_products_by_discount_priority(products)
-    
-    # First pass: one item per store, prioritizing discounted items
-    for product in sorted_products:
-        product_id = get_product_id(product)
-        price = product.get('numericPrice', float('inf'))
-        store = product.get('store', '').lower()
+    # First pass: one item per store, prioritizing discounted items.
+    # The store name is only looked up for entries that fit and are unused
+    for i, (product, price, product_id) in enumerate(entries):
+        if total_cost + min_prices[i] > budget:
+            break
+        if total_cost + price > budget or product_id in used_products:
+            continue
         
-        if (price != float('inf') and 
-            total_cost + price <= budget and 
-            store not in stores_used and
-            product_id not in used_products):
+        store = product.get('store', '').lower()
+        if store not in stores_used:
             items.append(product)
             total_cost += price
             stores_used.add(store)
             used_products.add(product_id)
     
     # Second pass: fill remaining budget with different items, still prioritizing discounted
-    for product in sorted_products:
-        product_id = get_product_id(product)
-        price = product.get('numericPrice', float('inf'))
-        
-        if (price != float('inf') and 
-            total_cost + price <= budget and 
-            product_id not in used_products):
-            items.append(product)
-            total_cost += price
-            used_products.add(product_id)
+    total_cost = fill_within_budget(entries, budget, used_products, items, total_cost, min_prices)
     
     return {'items': items, 'total_cost': total_cost}
 
-def generate_value_list_unique(products, budget, used_products):
+def generate_value_list_unique(entries, budget, used_products, min_prices):
     """Generate a list prioritizing discounted items and good value, avoiding already used products"""
     items = []
     total_cost = 0.0
     
-    # Sort products to prioritize discounted items first
-    sorted_products = sort_products_by_discount_priority(products)
-    
-    for product in sorted_products:
-        product_id = get_product_id(product)
-        price = product.get('numericPrice', float('inf'))
-        
-        if (price != float('inf') and 
-            total_cost + price <= budget and 
-            product_id not in used_products):
-            items.append(product)
-            total_cost += price
-            used_products.add(product_id)
+    # entries arrive sorted with discounted items first, then by price
+    total_cost = fill_within_budget(entries, budget, used_products, items, total_cost, min_prices)
     
     return {'items': items, 'total_cost': total_cost}
 
-def generate_balanced_list_unique(products, budget, used_products):
+def alternate(first, second):
+    """Yield first[0], second[0], first[1], second[1], ... then the rest of the longer list"""
+    for pair in zip(first, second):
+        yield from pair
+    shorter = min(len(first), len(second))
+    yield from first[shorter:]
+    yield from second[shorter:]
+
+def generate_balanced_list_unique(entries, budget, used_products, min_prices):
     """Generate a balanced list mixing affordable and mid-range items, avoiding already used products"""
     items = []
     total_cost = 0.0
     
-    # Sort products to prioritize discounted items first
-    sorted_products = sort_products_by_discount_priority(products)
-    
-    # Filter out already used products
-    available_products = [p for p in sorted_products if get_product_id(p) not in used_products]
-    
-    # Categorize products by price range
-    valid_products = [p for p in available_products if p.get('numericPrice', float('inf')) != float('inf')]
-    if not valid_products:
+    # Filter out already used products; every entry already has a usable price
+    valid_entries = [entry for entry in entries if entry[2] not in used_products]
+    if not valid_entries:
         return {'items': items, 'total_cost': total_cost}
     
-    prices = [p['numericPrice'] for p in valid_products]
-    avg_price = sum(prices) / len(prices)
-    
-    cheap_products = [p for p in valid_products if p['numericPrice'] <= avg_price * 0.7]
-    mid_products = [p for p in valid_products if avg_price * 0.7 < p['numericPrice'] <= avg_price * 1.3]
-    
-    # Alternate between cheap and mid-range items (both lists are already sorted with discounted items first)
-    cheap_idx = 0
-    mid_idx = 0
-    use_cheap = True
-    
-    while total_cost < budget:
-        if use_cheap and cheap_idx < len(cheap_products):
-            product = cheap_products[cheap_idx]
-            cheap_idx += 1
-        elif mid_idx < len(mid_products):
-            product = mid_products[mid_idx]
-            mid_idx += 1
-        elif cheap_idx < len(cheap_products):
-            product = cheap_products[cheap_idx]
-            cheap_idx += 1
-        else:
+    # Categorize products by price range
+    avg_price = sum(entry[1] for entry in valid_entries) / len(valid_entries)
+    cheap_limit = avg_price * 0.7
+    mid_limit = avg_price * 1.3
+    
+    # One pass splits the entries into both bands, keeping their order
+    cheap_entries = []
+    mid_entries = []
+    for entry in valid_entries:
+        price = entry[1]
+        if price <= cheap_limit:
+            cheap_entries.append(entry)
+        elif price <= mid_limit:
+            mid_entries.append(entry)
+    
+    # Alternate between cheap and mid-range items (both lists are already sorted with discounted items first);
+    # stop once not even the cheapest entry overall could still fit
+    lowest_price = min_prices[0]
+    for product, price, product_id in alternate(cheap_entries, mid_entries):
+        if total_cost >= budget or total_cost + lowest_price > budget:
             break
         
-        product_id = get_product_id(product)
-        price = product.get('numericPrice', float('inf'))
-        
         if (total_cost + price <= budget and 
             product_id not in used_products):
             items.append(product)
             total_cost += price
             used_products.add(product_id)
-        
-        use_cheap = not use_cheap
     
     return {'items': items, 'total_cost': total_cost}
 
-def generate_cheapest_list(products, budget):
-    """Generate a list focusing on the cheapest items, prioritizing discounted products"""
+def priced_products(products):
+    """(product, price) pairs, in order, for the products that have a usable numeric price"""
+    pairs = []
+    for product in products:
+        price = product.get('numericPrice')
+        if price is not None and price != INF:
+            pairs.append((product, price))
+    return pairs
+
+def greedy_priority_list(products, budget):
+    """Take products in discount-priority order while they still fit the budget"""
     items = []
     total_cost = 0.0
     
-    # Sort products to prioritize discounted items first
-    sorted_products = sort_products_by_discount_priority(products)
+    # Sort products to prioritize discounted items first, reading each price once
+    sorted_pairs = priced_products(sort_products_by_discount_priority(products))
     
-    for product in sorted_products:
-        price = product.get('numericPrice', float('inf'))
-        if price != float('inf') and total_cost + price <= budget:
+    for product, price in sorted_pairs:
+        if total_cost + price <= budget:
             items.append(product)
             total_cost += price
     
     return {'items': items, 'total_cost': total_cost}
 
+def generate_cheapest_list(products, budget):
+    """Generate a list focusing on the cheapest items, prioritizing discounted products"""
+    return greedy_priority_list(products, budget)
+
 def generate_variety_list(products, budget):
     """Generate a list with variety across different stores, prioritizing discounted products"""
     items = []
@@ -1066,32 +1375,29 @@ def generate_variety_list(products, budget):
     stores_used = set()
     used_products = set()
     
-    # Sort products to prioritize discounted items first
-    sorted_products = sort_products_by_discount_priority(products)
+    # Sort products to prioritize discounted items first, reading each price and id once for both passes
+    sorted_entries = [
+        (product, price, (product.get('title', ''), product.get('store', '')))
+        for product, price in priced_products(sort_products_by_discount_priority(products))
+    ]
     
-    # First pass: one item per store, prioritizing discounted items
-    for product in sorted_products:
-        price = product.get('numericPrice', float('inf'))
-        store = product.get('store', '').lower()
-        product_id = product.get('title', '') + product.get('store', '')
+    # First pass: one item per store, prioritizing discounted items.
+    # The store name is only lowered for entries that fit and are unused
+    for product, price, product_id in sorted_entries:
+        if total_cost + price > budget or product_id in used_products:
+            continue
         
-        if (price != float('inf') and 
-            total_cost + price <= budget and 
-            store not in stores_used and
-            product_id not in used_products):
+        store = product_id[1].lower()
+        if store not in stores_used:
             items.append(product)
             total_cost += price
             stores_used.add(store)
             used_products.add(product_id)
     
-    # Second pass: fill remaining budget with different items, still prioritizing discounted
-    remaining_products = [p for p in sorted_products if (p.get('title', '') + p.get('store', '')) not in used_products]
-    for product in remaining_products:
-        price = product.get('numericPrice', float('inf'))
-        product_id = product.get('title', '') + product.get('store', '')
-        
-        if (price != float('inf') and 
-            total_cost + price <= budget and 
+    # Second pass: fill remaining budget with different items, still prioritizing discounted.
+    # The used_products set check skips first-pass picks, so no filtered copy of the list is needed
+    for product, price, product_id in sorted_entries:
+        if (total_cost + price <= budget and 
             product_id not in used_products):
             items.append(product)
             total_cost += price
@@ -1101,101 +1407,88 @@ def generate_variety_list(products, budget):
 
 def generate_value_list(products, budget):
     """Generate a list prioritizing discounted items and good value"""
-    items = []
-    total_cost = 0.0
-    
-    # Sort products to prioritize discounted items first (this already does what we want)
-    sorted_products = sort_products_by_discount_priority(products)
-    
-    for product in sorted_products:
-        price = product.get('numericPrice', float('inf'))
-        if price != float('inf') and total_cost + price <= budget:
-            items.append(product)
-            total_cost += price
-    
-    return {'items': items, 'total_cost': total_cost}
+    # The discount-priority order already does what we want, so this is the cheapest fill
+    return greedy_priority_list(products, budget)
 
 def generate_balanced_list(products, budget):
     """Generate a balanced list mixing affordable and mid-range items, prioritizing discounted products"""
     items = []
     total_cost = 0.0
     
-    # Sort products to prioritize discounted items first
-    sorted_products = sort_products_by_discount_priority(products)
-    
-    # Categorize products by price range
-    valid_products = [p for p in sorted_products if p.get('numericPrice', float('inf')) != float('inf')]
-    if not valid_products:
+    # Sort products to prioritize discounted items first, keeping only usable prices
+    valid_pairs = priced_products(sort_products_by_discount_priority(products))
+    if not valid_pairs:
         return {'items': items, 'total_cost': total_cost}
     
-    prices = [p['numericPrice'] for p in valid_products]
-    avg_price = sum(prices) / len(prices)
-    
-    cheap_products = [p for p in valid_products if p['numericPrice'] <= avg_price * 0.7]
-    mid_products = [p for p in valid_products if avg_price * 0.7 < p['numericPrice'] <= avg_price * 1.3]
+    # Categorize products by price range
+    avg_price = sum(price for _, price in valid_pairs) / len(valid_pairs)
+    cheap_limit = avg_price * 0.7
+    mid_limit = avg_price * 1.3
+    
+    # One pass splits the pairs into both bands, keeping their order
+    cheap_products = []
+    mid_products = []
+    for pair in valid_pairs:
+        price = pair[1]
+        if price <= cheap_limit:
+            cheap_products.append(pair)
+        elif price <= mid_limit:
+            mid_products.append(pair)
     
     # Alternate between cheap and mid-range items (both lists are already sorted with discounted items first)
-    cheap_idx = 0
-    mid_idx = 0
-    use_cheap = True
-    
-    while total_cost < budget:
-        if use_cheap and cheap_idx < len(cheap_products):
-            product = cheap_products[cheap_idx]
-            cheap_idx += 1
-        elif mid_idx < len(mid_products):
-            product = mid_products[mid_idx]
-            mid_idx += 1
-        elif cheap_idx < len(cheap_products):
-            product = cheap_products[cheap_idx]
-            cheap_idx += 1
-        else:
+    for product, price in alternate(cheap_products, mid_products):
+        if total_cost >= budget:
             break
         
-        price = product.get('numericPrice', float('inf'))
         if total_cost + price <= budget:
             items.append(product)
             total_cost += price
-        
-        use_cheap = not use_cheap
     
     return {'items': items, 'total_cost': total_cost}
 
+def validate_list_request(data):
+    """Check the search_keys and budget of a list generation request; returns (search_keys, budget, error)"""
+    search_keys = data.get('search_keys', [])
+    budget = data.get('budget')
+    
+    if not search_keys:
+        return None, None, 'search_keys parameter is required and must be a non-empty array'
+    
+    if not isinstance(search_keys, list):
+        return None, None, 'search_keys must be an array of strings'
+    
+    if budget is None:
+        return None, None, 'budget parameter is required'
+    
+    try:
+        budget = float(budget)
+    except (ValueError, TypeError):
+        return None, None, 'budget must be a valid number'
+    if budget <= 0:
+        return None, None, 'budget must be a positive number'
+    
+    return search_keys, budget, None
+
 @grocery_bp.route('/auto-generated-list', methods=['POST'])
 @cross_origin()
 def auto_generated_list():
     """Generate 4 optimized shopping lists within budget based on search keys"""
     try:
-        data = request.get_json()
+        data = request.get_json(silent=True)
         
         # Validate required parameters
         if not data:
             return jsonify({'error': 'Request body is required'}), 400
         
-        search_keys = data.get('search_keys', [])
-        budget = data.get('budget')
-        
-        if not search_keys:
-            return jsonify({'error': 'search_keys parameter is required and must be a non-empty array'}), 400
-        
-        if not isinstance(search_keys, list):
-            return jsonify({'error': 'search_keys must be an array of strings'}), 400
-        
-        if budget is None:
-            return jsonify({'error': 'budget parameter is required'}), 400
-        
-        try:
-            budget = float(budget)
-            if budget <= 0:
-                return jsonify({'error': 'budget must be a positive number'}), 400
-        except (ValueError, TypeError):
-            return jsonify({'error': 'budget must be a valid number'}), 400
+        search_keys, budget, error = validate_list_request(data)
+        if error:
+            return jsonify({'error': error}), 400
         
         # Optional parameters
         max_results_per_store = data.get('max_results_per_store', 50)
         selected_stores = data.get('selected_stores', [])  # New parameter for store selection
         
-        log_and_print(f"Generating auto shopping lists for search keys: {search_keys}, budget: ${budget}, stores: {selected_stores}")
+        logger.info(f"Generating auto shopping lists for search keys: {search_keys}, budget: ${budget}, stores: {selected_stores}")
         
         # Search selected stores (or all stores if none specified) for all search keys
         all_products = search_all_stores(search_keys, max_results_per_store, selected_stores)
@@ -1211,7 +1504,7 @@ def auto_generated_list():
         
         # Filter products within individual budget (optional safety check)
         affordable_products = [p for p in all_products 
-                             if p.get('numericPrice', float('inf')) <= budget]
+                             if p.get('numericPrice', INF) <= budget]
         
         if not affordable_products:
             return jsonify({
@@ -1220,7 +1513,7 @@ def auto_generated_list():
                 'search_keys': search_keys,
                 'budget': budget,
                 'total_products_found': len(all_products),
-                'cheapest_product_price': min([p.get('numericPrice', float('inf')) for p in all_products]),
+                'cheapest_product_price': min(p.get('numericPrice', INF) for p in all_products),
                 'lists': []
             })
         
@@ -1239,13 +1532,13 @@ def auto_generated_list():
             'lists': shopping_lists,
             'used_products': list(used_products),  # Convert set to list for JSON serialization
             'used_names': list(used_names),  # Convert set to list for JSON serialization
-            'generated_at': time.strftime('%Y-%m-%dT%H:%M:%SZ')
+            'generated_at': utc_timestamp()
         }
         
         return jsonify(response)
         
     except Exception as e:
-        log_and_print(f"Error in auto_generated_list: {e}", 'error')
+        logger.error(f"Error in auto_generated_list: {e}")
         return jsonify({
             'error': 'Internal server error', 
             'details': str(e)
@@ -1256,38 +1549,24 @@ def auto_generated_list():
 def auto_generated_list_more():
     """Generate 4 additional optimized shopping lists within budget, avoiding previously used products"""
     try:
-        data = request.get_json()
+        data = request.get_json(silent=True)
         
         # Validate required parameters
         if not data:
             return jsonify({'error': 'Request body is required'}), 400
         
-        search_keys = data.get('search_keys', [])
-        budget = data.get('budget')
+        search_keys, budget, error = validate_list_request(data)
+        if error:
+            return jsonify({'error': error}), 400
+        
         used_products = data.get('used_products', [])
         used_names = data.get('used_names', [])
         
-        if not search_keys:
-            return jsonify({'error': 'search_keys parameter is required and must be a non-empty array'}), 400
-        
-        if not isinstance(search_keys, list):
-            return jsonify({'error': 'search_keys must be an array of strings'}), 400
-        
-        if budget is None:
-            return jsonify({'error': 'budget parameter is required'}), 400
-        
-        try:
-            budget = float(budget)
-            if budget <= 0:
-                return jsonify({'error': 'budget must be a positive number'}), 400
-        except (ValueError, TypeError):
-            return jsonify({'error': 'budget must be a valid number'}), 400
-        
         # Optional parameters
         max_results_per_store = data.get('max_results_per_store', 50)
         selected_stores = data.get('selected_stores', [])
         
-        log_and_print(f"Generating additional shopping lists for search keys: {search_keys}, budget: ${budget}, stores: {selected_stores}")
+        logger.info(f"Generating additional shopping lists for search keys: {search_keys}, budget: ${budget}, stores: {selected_stores}")
         
         # Search selected stores (or all stores if none specified) for all search keys
         all_products = search_all_stores(search_keys, max_results_per_store, selected_stores)
@@ -1302,7 +1581,7 @@ def auto_generated_list_more():
         
         # Filter products within individual budget (optional safety check)
         affordable_products = [p for p in all_products 
-                             if p.get('numericPrice', float('inf')) <= budget]
+                             if p.get('numericPrice', INF) <= budget]
         
         if not affordable_products:
             return jsonify({
@@ -1311,7 +1590,7 @@ def auto_generated_list_more():
                 'search_keys': search_keys,
                 'budget': budget,
                 'total_products_found': len(all_products),
-                'cheapest_product_price': min([p.get('numericPrice', float('inf')) for p in all_products]),
+                'cheapest_product_price': min(p.get('numericPrice', INF) for p in all_products),
                 'lists': []
             })
         
@@ -1339,24 +1618,68 @@ def auto_generated_list_more():
             'lists': shopping_lists,
             'used_products': list(updated_used_products),  # Updated list of used products
             'used_names': list(updated_used_names),  # Updated list of used names
-            'generated_at': time.strftime('%Y-%m-%dT%H:%M:%SZ')
+            'generated_at': utc_timestamp()
         }
         
         return jsonify(response)
         
     except Exception as e:
-        log_and_print(f"Error in auto_generated_list_more: {e}", 'error')
+        logger.error(f"Error in auto_generated_list_more: {e}")
         return jsonify({
             'error': 'Internal server error', 
             'details': str(e)
         }), 500
 
+# Default search terms per dietary preference for stores searched by keyword (IGA/ALDI)
+DIETARY_SEARCH_TERMS_API_STORES = {
+    'none': [
+        # General groceries - any food items (non-veg and veg)
+        'milk', 'eggs', 'rice', 'pasta', 
+        'yogurt', 'fruit', 'vegetables', 'meat', 'dairy',
+        'grocery',
+    ],  
+    'vegetarian': [
+        'vegetarian protein', 'tofu', 'beans', 'lentils', 'vegetarian curry', 'vegetarian soup', 'nuts', 'seeds',
+        'vegetables'
+    ],
+    'vegan': [
+        'vegan protein', 'tofu', 'tempeh', 'vegan cheese', 'milk', 'yeast', 'yogurt', 'agave', 'maple syrup', 'cashew cream'
+    ],
+    'gluten free': [
+        'gluten free', 'rice', 'flour',  'rice cakes', 'corn tortillas', 'rice noodles'
+    ],
+    'others': [
+        'bread', 'milk', 'eggs', 'rice', 'pasta', 
+        'yogurt', 'cereal', 'fruit', 'vegetables', 'meat', 
+        'grocery',
+    ]
+}
+
+# Default search terms per dietary preference for all other stores
+DIETARY_SEARCH_TERMS_DEFAULT = {
+    'none': [
+        'grocery'
+    ],  
+    'vegetarian': [
+        'vegetarian'
+    ],
+    'vegan': [
+        'vegan'
+    ],
+    'gluten free': [
+        'gluten free'
+    ],
+    'others': [
+        'others'
+    ]
+}
+
 @grocery_bp.route('/store/<store_name>', methods=['POST'])
 @cross_origin()
 def search_store_products(store_name):
     """Search for multiple products in a specific store, returning 10 cheapest items for each search term"""
     try:
-        data = request.get_json()
+        data = request.get_json(silent=True)
 
         if not data:
             return jsonify({'error': 'Request body is required'}), 400
@@ -1369,53 +1692,15 @@ def search_store_products(store_name):
         # Get max_results from request or use default based on store
         if(store_name in ['iga', 'aldi']):
             max_results = data.get('max_results', 10)  # Default 10 for IGA/ALDI/Harris
-            dietary_search_terms = {
-                'none': [
-                    # General groceries - any food items (non-veg and veg)
-                    'milk', 'eggs', 'rice', 'pasta', 
-                    'yogurt', 'fruit', 'vegetables', 'meat', 'dairy',
-                    'grocery',
-                ],  
-                'vegetarian': [
-                    'vegetarian protein', 'tofu', 'beans', 'lentils', 'vegetarian curry', 'vegetarian soup', 'nuts', 'seeds',
-                    'vegetables'
-                ],
-                'vegan': [
-                    'vegan protein', 'tofu', 'tempeh', 'vegan cheese', 'milk', 'yeast', 'yogurt', 'agave', 'maple syrup', 'cashew cream'
-                ],
-                'gluten free': [
-                    'gluten free', 'rice', 'flour',  'rice cakes', 'corn tortillas', 'rice noodles'
-                ],
-                'others': [
-                    'bread', 'milk', 'eggs', 'rice', 'pasta', 
-                    'yogurt', 'cereal', 'fruit', 'vegetables', 'meat', 
-                    'grocery',
-                ]
-            }
+            dietary_search_terms = DIETARY_SEARCH_TERMS_API_STORES
         else:
             max_results = data.get('max_results', 50)  # Default 50 for other stores
-            dietary_search_terms = {
-                'none': [
-                    'grocery'
-                ],  
-                'vegetarian': [
-                    'vegetarian'
-                ],
-                'vegan': [
-                    'vegan'
-                ],
-                'gluten free': [
-                    'gluten free'
-                ],
-                'others': [
-                    'others'
-                ]
-            }
+            dietary_search_terms = DIETARY_SEARCH_TERMS_DEFAULT
         # Use client-provided search_terms if present; otherwise use dietary preference defaults
         if not search_terms:
             if dietary_preference in dietary_search_terms:
                 search_terms = dietary_search_terms[dietary_preference]
-                log_and_print(f"Using dietary preference '{dietary_preference}' with {len(search_terms)} search terms")
+                logger.info(f"Using dietary preference '{dietary_preference}' with {len(search_terms)} search terms")
             else:
                 return jsonify({'error': f'Invalid dietary_preference "{dietary_preference}". Supported: none, vegetarian, vegan, gluten free, others'}), 400
         
@@ -1427,10 +1712,12 @@ def search_store_products(store_name):
                 'error': f'Invalid store "{store_name}". Supported stores: {", ".join(valid_stores)}'
             }), 400
         
-        log_and_print(f"Searching {store_name} for multiple terms: {search_terms}")
+        logger.info(f"Searching {store_name} for multiple terms: {search_terms}")
         
         all_products = []
         search_term_stats = []
+        # One timestamp per request, used for products without their own scraped_at
+        scraped_at = utc_timestamp()
 
         def scrape_single_term(search_term: str):
             term = search_term.strip()
@@ -1443,10 +1730,10 @@ def search_store_products(store_name):
                 }
 
             if store_name in ['aldi', 'iga', 'harris', 'coles']:
-                log_and_print(f"line 1290: Using Python scraper for '{store_name}' for '{term}' with max_results '{max_results}'")
+                logger.info(f"line 1290: Using Python scraper for '{store_name}' for '{term}' with max_results '{max_results}'")
                 scraper_result = run_python_scrapers(term, [store_name], max_results)
             else:
-                log_and_print(f"Store '{store_name}' is not supported")
+                logger.info(f"Store '{store_name}' is not supported")
                 return [], {
                     'search_term': term,
                     'total_found': 0,
@@ -1455,7 +1742,7 @@ def search_store_products(store_name):
                 }
 
             if 'error' in scraper_result:
-                log_and_print(f"Error searching for {term} in {store_name}: {scraper_result['error']}", 'error')
+                logger.error(f"Error searching for {term} in {store_name}: {scraper_result['error']}")
                 return [], {
                     'search_term': term,
                     'total_found': 0,
@@ -1488,7 +1775,7 @@ def search_store_products(store_name):
                     "category": p.get("category", ""),
                     "productUrl": p.get("productUrl", ""),
                     "search_term": term,
-                    "scraped_at": p.get("scraped_at", time.strftime('%Y-%m-%dT%H:%M:%SZ'))
+                    "scraped_at": p.get("scraped_at", scraped_at)
                 }
                 if product["numericPrice"] > 0:
                     processed_products.append(product)
@@ -1498,7 +1785,7 @@ def search_store_products(store_name):
                 'total_found': len(processed_products),
                 'products_returned': len(processed_products)
             }
-            log_and_print(f"Found {len(processed_products)} total, returning all {len(processed_products)} products for '{term}' in {store_name}")
+            logger.info(f"Found {len(processed_products)} total, returning all {len(processed_products)} products for '{term}' in {store_name}")
             return processed_products, stat
 
         # Parallelize scraping across search terms
@@ -1511,7 +1798,7 @@ def search_store_products(store_name):
                     all_products.extend(products_result)
                     search_term_stats.append(stat_result)
                 except Exception as e:
-                    log_and_print(f"Worker error: {e}", 'error')
+                    logger.error(f"Worker error: {e}")
         
         
         return jsonify({
@@ -1523,106 +1810,107 @@ def search_store_products(store_name):
             'search_term_stats': search_term_stats,
             'total_products': len(all_products),
             'products': all_products,
-            'scraped_at': time.strftime('%Y-%m-%dT%H:%M:%SZ')
+            'scraped_at': scraped_at
         })
         
     except Exception as e:
-        log_and_print(f"Error in search_store_products: {e}", 'error')
+        logger.error(f"Error in search_store_products: {e}")
         return jsonify({
             'error': 'Internal server error',
             'details': str(e)
         }), 500
 
+# Predefined categories with appropriate images (static, built once at import)
+CATEGORIES = [
+    {
+        "id": "fruits",
+        "name": "Fruits",
+        "image": "https://images.unsplash.com/photo-1610832958506-aa56368176cf?q=80&w=200&auto=format&fit=crop",
+        "description": "Fresh fruits and seasonal produce"
+    },
+    {
+        "id": "vegetables", 
+        "name": "Vegetables",
+        "image": "https://images.unsplash.com/photo-1557844352-761f2565b576?q=80&w=200&auto=format&fit=crop",
+        "description": "Fresh vegetables and greens"
+    },
+    {
+        "id": "dairy",
+        "name": "Dairy",
+        "image": "https://images.unsplash.com/photo-1628088062854-d1870b4553da?q=80&w=200&auto=format&fit=crop",
+        "description": "Milk, cheese, yogurt and dairy products"
+    },
+    {
+        "id": "meat",
+        "name": "Meat & Poultry",
+        "image": "https://images.unsplash.com/photo-1467825487722-2a7c4cd62e75?w=900&auto=format&fit=crop&q=60",
+        "description": "Fresh meat, chicken, and poultry"
+    },
+    {
+        "id": "bakery",
+        "name": "Bakery",
+        "image": "https://images.unsplash.com/photo-1608198093002-ad4e005484ec?w=900&auto=format&fit=crop&q=60",
+        "description": "Fresh bread, pastries and baked goods"
+    },
+    {
+        "id": "pantry",
+        "name": "Pantry Staples",
+        "image": "https://images.unsplash.com/photo-1590779033100-9f60a05a013d?w=900&auto=format&fit=crop&q=60",
+        "description": "Rice, pasta, grains and pantry essentials"
+    },
+    {
+        "id": "snacks",
+        "name": "Snacks",
+        "image": "https://images.unsplash.com/photo-1621939514649-280e2ee25f60?w=900&auto=format&fit=crop&q=60",
+        "description": "Chips, nuts, crackers and snack foods"
+    },
+    {
+        "id": "beverages",
+        "name": "Beverages",
+        "image": "https://images.unsplash.com/photo-1595981267035-7b04ca84a82d?w=900&auto=format&fit=crop&q=60",
+        "description": "Juices, soft drinks and beverages"
+    },
+    {
+        "id": "frozen",
+        "name": "Frozen Foods",
+        "image": "https://images.unsplash.com/photo-1578662996442-48f60103fc96?w=900&auto=format&fit=crop&q=60",
+        "description": "Frozen vegetables, meals and ice cream"
+    },
+    {
+        "id": "seafood",
+        "name": "Seafood",
+        "image": "https://images.unsplash.com/photo-1565680018434-b513d5573b07?w=900&auto=format&fit=crop&q=60",
+        "description": "Fresh fish and seafood"
+    },
+    {
+        "id": "breakfast",
+        "name": "Breakfast",
+        "image": "https://images.unsplash.com/photo-1533089860892-a7c6f0a88110?w=900&auto=format&fit=crop&q=60",
+        "description": "Cereals, oats and breakfast items"
+    },
+    {
+        "id": "healthy",
+        "name": "Health & Organic",
+        "image": "https://images.unsplash.com/photo-1512621776951-a57141f2eefd?w=900&auto=format&fit=crop&q=60",
+        "description": "Organic and health food products"
+    }
+]
+
+CATEGORIES_RESPONSE = {
+    'success': True,
+    'categories': CATEGORIES,
+    'total_categories': len(CATEGORIES),
+    'message': f'{len(CATEGORIES)} categories available'
+}
+
 @grocery_bp.route('/categories', methods=['GET'])
 @cross_origin()
 def get_categories():
     """Get list of available grocery categories with images"""
     try:
-        # Define predefined categories with appropriate images
-        categories = [
-            {
-                "id": "fruits",
-                "name": "Fruits",
-                "image": "https://images.unsplash.com/photo-1610832958506-aa56368176cf?q=80&w=200&auto=format&fit=crop",
-                "description": "Fresh fruits and seasonal produce"
-            },
-            {
-                "id": "vegetables", 
-                "name": "Vegetables",
-                "image": "https://images.unsplash.com/photo-1557844352-761f2565b576?q=80&w=200&auto=format&fit=crop",
-                "description": "Fresh vegetables and greens"
-            },
-            {
-                "id": "dairy",
-                "name": "Dairy",
-                "image": "https://images.unsplash.com/photo-1628088062854-d1870b4553da?q=80&w=200&auto=format&fit=crop",
-                "description": "Milk, cheese, yogurt and dairy products"
-            },
-            {
-                "id": "meat",
-                "name": "Meat & Poultry",
-                "image": "https://images.unsplash.com/photo-1467825487722-2a7c4cd62e75?w=900&auto=format&fit=crop&q=60",
-                "description": "Fresh meat, chicken, and poultry"
-            },
-            {
-                "id": "bakery",
-                "name": "Bakery",
-                "image": "https://images.unsplash.com/photo-1608198093002-ad4e005484ec?w=900&auto=format&fit=crop&q=60",
-                "description": "Fresh bread, pastries and baked goods"
-            },
-            {
-                "id": "pantry",
-                "name": "Pantry Staples",
-                "image": "https://images.unsplash.com/photo-1590779033100-9f60a05a013d?w=900&auto=format&fit=crop&q=60",
-                "description": "Rice, pasta, grains and pantry essentials"
-            },
-            {
-                "id": "snacks",
-                "name": "Snacks",
-                "image": "https://images.unsplash.com/photo-1621939514649-280e2ee25f60?w=900&auto=format&fit=crop&q=60",
-                "description": "Chips, nuts, crackers and snack foods"
-            },
-            {
-                "id": "beverages",
-                "name": "Beverages",
-                "image": "https://images.unsplash.com/photo-1595981267035-7b04ca84a82d?w=900&auto=format&fit=crop&q=60",
-                "description": "Juices, soft drinks and beverages"
-            },
-            {
-                "id": "frozen",
-                "name": "Frozen Foods",
-                "image": "https://images.unsplash.com/photo-1578662996442-48f60103fc96?w=900&auto=format&fit=crop&q=60",
-                "description": "Frozen vegetables, meals and ice cream"
-            },
-            {
-                "id": "seafood",
-                "name": "Seafood",
-                "image": "https://images.unsplash.com/photo-1565680018434-b513d5573b07?w=900&auto=format&fit=crop&q=60",
-                "description": "Fresh fish and seafood"
-            },
-            {
-                "id": "breakfast",
-                "name": "Breakfast",
-                "image": "https://images.unsplash.com/photo-1533089860892-a7c6f0a88110?w=900&auto=format&fit=crop&q=60",
-                "description": "Cereals, oats and breakfast items"
-            },
-            {
-                "id": "healthy",
-                "name": "Health & Organic",
-                "image": "https://images.unsplash.com/photo-1512621776951-a57141f2eefd?w=900&auto=format&fit=crop&q=60",
-                "description": "Organic and health food products"
-            }
-        ]
-        
-        return jsonify({
-            'success': True,
-            'categories': categories,
-            'total_categories': len(categories),
-            'message': f'{len(categories)} categories available'
-        })
-        
+        return static_json_response('categories', CATEGORIES_RESPONSE)
     except Exception as e:
-        log_and_print(f"Error in get_categories: {e}", 'error')
+        logger.error(f"Error in get_categories: {e}")
         return jsonify({
             'error': 'Internal server error',
             'details': str(e)
@@ -1633,7 +1921,7 @@ def get_categories():
 def search_category_products(category_name):
     """Search for products in a specific category across all supported stores with pagination"""
     try:
-        data = request.get_json()
+        data = request.get_json(silent=True)
         
         # Get parameters with defaults
         max_results = data.get('max_results', 20) if data else 20
@@ -1647,18 +1935,18 @@ def search_category_products(category_name):
             stores = data.get('stores', ['aldi', 'iga', 'harris', 'coles']) if data else ['aldi', 'iga', 'harris', 'coles']
         
         page = data.get('page', 1) if data else 1
-        per_page = data.get('per_page', 10) if data else 10
+        per_page = min(data.get('per_page', 10), MAX_PER_PAGE) if data else 10
         
         # Check cache first
         cache_key = get_category_cache_key(category_name, stores, f"{dietary_preference}_{fast_mode}")
-        if cache_key in search_cache and is_cache_valid(search_cache[cache_key]):
-            log_and_print(f"Cache hit for category '{category_name}' with stores {stores}")
-            cached_result = search_cache[cache_key]['data']
+        cached_result = cache_get(cache_key)
+        if cached_result is not None:
+            logger.info(f"Cache hit for category '{category_name}' with stores {stores}")
             all_products = cached_result.get('products', [])
             search_term = cached_result.get('search_term', category_name.lower())
         else:
             # Cache miss - need to scrape
-            log_and_print(f"Cache miss for category '{category_name}' - performing fresh search")
+            logger.info(f"Cache miss for category '{category_name}' - performing fresh search")
             
             # Use the category name directly as the search term
             search_term = category_name.lower()
@@ -1681,17 +1969,19 @@ def search_category_products(category_name):
             elif dietary_preference == 'gluten free':
                 search_term = f"gluten free {category_name.lower()}"
             
-            log_and_print(f"Searching category '{category_name}' with search term: '{search_term}' (dietary: {dietary_preference})")
-            log_and_print(f"Using max 30 products per store for category search across stores: {stores}")
+            logger.info(f"Searching category '{category_name}' with search term: '{search_term}' (dietary: {dietary_preference})")
+            logger.info(f"Using max 30 products per store for category search across stores: {stores}")
             
             all_products = []
+            # Results missing a store that timed out are served but not cached, so the next request retries it
+            complete = True
             
             # Search the category name across supported stores using the existing Python scrapers
             try:
                 # Use run_python_scrapers to search across all stores
                 # Limit each store to 30 products maximum for category searches (per user request)
                 max_results_per_store = 30
-                log_and_print(f"Calling scrapers with max_results_per_store={max_results_per_store}")
+                logger.info(f"Calling scrapers with max_results_per_store={max_results_per_store}")
                 scraper_result = run_python_scrapers(
                     search_term, 
                     stores, 
@@ -1699,45 +1989,40 @@ def search_category_products(category_name):
                 )
                 
                 if 'products' in scraper_result and scraper_result['products']:
-                    # Add category metadata to products
-                    for product in scraper_result['products']:
-                        product['category'] = category_name
-                        product['search_term'] = search_term
-                    
                     all_products.extend(scraper_result['products'])
-                    log_and_print(f"Found {len(scraper_result['products'])} products for category '{category_name}'")
+                    logger.info(f"Found {len(scraper_result['products'])} products for category '{category_name}'")
+                if 'timed_out_stores' in scraper_result:
+                    complete = False
                     
             except Exception as e:
-                log_and_print(f"Error searching for category '{category_name}': {e}", 'warning')
+                logger.warning(f"Error searching for category '{category_name}': {e}")
             
             # Remove duplicates based on title and store
             seen = set()
             unique_products = []
             for product in all_products:
-                key = f"{product.get('title', '').lower()}_{product.get('store', '').lower()}"
+                # Tuple keys hash the two parts directly, without building a joined string
+                key = (product.get('title', '').lower(), product.get('store', '').lower())
                 if key not in seen:
                     seen.add(key)
-                    unique_products.append(product)
+                    # Add category metadata to a copy; scraped products may be shared with the scrape cache
+                    unique_products.append({**product, 'category': category_name, 'search_term': search_term})
             
             # Sort by price (cheapest first)
-            unique_products.sort(key=lambda x: x.get('numericPrice', float('inf')))
+            unique_products.sort(key=price_sort_key)
             
             # Cache the results
-            search_cache[cache_key] = {
-                'timestamp': time.time(),
-                'data': {
+            if complete:
+                cache_set(cache_key, {
                     'products': unique_products,
                     'search_term': search_term
-                }
-            }
-            log_and_print(f"Cached results for category '{category_name}' with {len(unique_products)} products")
+                })
+                logger.info(f"Cached results for category '{category_name}' with {len(unique_products)} products")
             all_products = unique_products
         
         # Apply pagination
         total_products = len(all_products)
-        start_index = (page - 1) * per_page
-        end_index = start_index + per_page
-        paginated_products = all_products[start_index:end_index]
+        paginated_products, _ = paginate(all_products, page, per_page)
         
         # Calculate pagination info
         total_pages = (total_products + per_page - 1) // per_page  # Ceiling division
@@ -1767,11 +2052,11 @@ def search_category_products(category_name):
             },
             'total_products': len(paginated_products),
             'products': paginated_products,
-            'scraped_at': time.strftime('%Y-%m-%dT%H:%M:%SZ')
+            'scraped_at': utc_timestamp()
         })
         
     except Exception as e:
-        log_and_print(f"Error in search_category_products: {e}", 'error')
+        logger.error(f"Error in search_category_products: {e}")
         return jsonify({
             'error': 'Internal server error',
             'details': str(e)
@@ -1783,14 +2068,12 @@ def serve_logo(logo_name):
     """Serve store logo images"""
     try:
         # Get the path to the local logos directory within grocery-api
-        current_dir = os.path.dirname(os.path.abspath(__file__))
-        logos_path = os.path.join(current_dir, '..', '..', 'logos')
-        logo_file_path = os.path.join(logos_path, logo_name)
+        logo_file_path = os.path.join(LOGOS_PATH, logo_name)
         
         # Check if file exists and is a valid image file
         if not os.path.exists(logo_file_path):
             # Return default store logo if specific logo not found
-            default_logo_path = os.path.join(logos_path, 'default-store.png')
+            default_logo_path = os.path.join(LOGOS_PATH, 'default-store.png')
             if os.path.exists(default_logo_path):
                 return send_file(default_logo_path, mimetype='image/png')
             else:
@@ -1811,6 +2094,6 @@ def serve_logo(logo_name):
         return send_file(logo_file_path, mimetype=mimetype)
         
     except Exception as e:
-        log_and_print(f"Error serving logo {logo_name}: {e}", 'error')
+        logger.error(f"Error serving logo {logo_name}: {e}")
         return jsonify({'error': 'Internal server error'}), 500
 
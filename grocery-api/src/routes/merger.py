@@ -4,6 +4,13 @@ import os
 import json
 from flask import Blueprint, jsonify
 
+# orjson parses the downloaded product files several times faster than the stdlib
+try:
+    import orjson
+    json_loads = orjson.loads
+except ImportError:
+    json_loads = json.loads
+
 merger_bp = Blueprint('merger', __name__)
 
 def merge_json_files(folder_name):
@@ -27,9 +34,9 @@ def merge_json_files(folder_name):
     for filename in os.listdir(input_dir):
         if filename.endswith(".json"):
             filepath = os.path.join(input_dir, filename)
-            with open(filepath, 'r') as f:
+            with open(filepath, 'rb') as f:
                 try:
-                    data = json.load(f)
+                    data = json_loads(f.read())
                     if "products" in data and isinstance(data["products"], list):
                         for product in data["products"]:
                             total_items += 1
@@ -2,10 +2,25 @@ import requests
 import time
 import sys
 import logging
+from requests.adapters import HTTPAdapter
 
 # Configure logging
 logger = logging.getLogger(__name__)
 
+# (connect, read) timeout for ALDI API calls, so a stalled response can't hang a search
+REQUEST_TIMEOUT = (3.05, 10)
+
+
+def _build_session():
+    """Create a pooled keep-alive session for the ALDI API"""
+    session = requests.Session()
+    session.mount('https://', HTTPAdapter(pool_connections=4, pool_maxsize=16))
+    return session
+
+
+# Shared module-level session so repeated searches reuse the TLS connection
+SESSION = _build_session()
+
 def log_and_print(message, level='info'):
     """Log message once using the configured logger"""
     if level.lower() == 'info':
@@ -55,14 +70,15 @@ def fetch_aldi_products_with_discount(query, limit=24, service_point='G452'):
             'servicePoint': service_point
         }
 
-        response = requests.get(base_url, params=params)
+        response = SESSION.get(base_url, params=params, timeout=REQUEST_TIMEOUT)
         if response.status_code != 200:
             log_and_print(f"Failed to fetch data: HTTP {response.status_code}")
             break
 
         data = response.json()
 
-        log_and_print(f"line 57: Data length: {len(data)}")
+        # Per-page and per-category detail is debug-only; %-style args are formatted only if emitted
+        logger.debug("line 57: Data length: %d", len(data))
         if 'data' not in data or len(data['data']) == 0:
             break
 
@@ -135,8 +151,8 @@ def fetch_aldi_special_products(service_point='G452', limit=16):
         # 'servicePoint': service_point
     }
     
-    print("Fetching categories...")
-    categories_response = requests.get(categories_url, params=categories_params)
+    log_and_print("Fetching categories...")
+    categories_response = SESSION.get(categories_url, params=categories_params, timeout=REQUEST_TIMEOUT)
     if categories_response.status_code != 200:
         log_and_print(f"Failed to fetch categories: HTTP {categories_response.status_code}")
         return {}
@@ -154,7 +170,7 @@ def fetch_aldi_special_products(service_point='G452', limit=16):
             if category_key:
                 category_keys.append((category_key, category_name))
             
-            log_and_print(f"Category: {category_name}")
+            logger.debug("Category: %s", category_name)
             
             # Check for subcategories
             # subcategories = category.get('children', [])
@@ -191,7 +207,7 @@ def fetch_aldi_special_products(service_point='G452', limit=16):
             'servicePoint': service_point
         }
         
-        products_response = requests.get(products_url, params=products_params)
+        products_response = SESSION.get(products_url, params=products_params, timeout=REQUEST_TIMEOUT)
         if products_response.status_code != 200:
             log_and_print(f"Failed to fetch products for category {category_name}: HTTP {products_response.status_code}")
             continue
@@ -228,9 +244,9 @@ def fetch_aldi_special_products(service_point='G452', limit=16):
                 all_products.append(product)
         
         if 'data' in products_data and products_data['data']:
-            log_and_print(f"  Found {len(products_data['data'])} products")
+            logger.debug("  Found %d products", len(products_data['data']))
         else:
-            log_and_print(f"  No products found")
+            logger.debug("  No products found")
         
         # Respectful delay between API calls
         time.sleep(0.5)
@@ -4,6 +4,13 @@ import time
 import sys
 import logging
 
+# orjson parses the large merged products file several times faster than the stdlib
+try:
+    import orjson
+    json_loads = orjson.loads
+except ImportError:
+    json_loads = json.loads
+
 # Configure logging
 logger = logging.getLogger(__name__)
 
@@ -55,8 +62,9 @@ def load_coles_products():
                 return []
             
             # Read and parse the JSON file
-            with open(merged_file_path, 'r', encoding='utf-8') as file:
-                _coles_products_cache = json.load(file)
+            # Read bytes so orjson can parse without decoding to str first
+            with open(merged_file_path, 'rb') as file:
+                _coles_products_cache = json_loads(file.read())
             
             _cache_timestamp = time.time()
             _cache_file_path = merged_file_path
@@ -1,12 +1,6 @@
 import requests
 import time
 from typing import List, Dict, Tuple
-from selenium import webdriver
-from selenium.webdriver.common.by import By
-from selenium.webdriver.support.ui import WebDriverWait
-from selenium.webdriver.support import expected_conditions as EC
-from selenium.webdriver.chrome.options import Options
-from selenium.common.exceptions import TimeoutException, WebDriverException
 
 
 def parse_complex_price(price_string: str) -> Dict[str, str]:
@@ -93,6 +87,10 @@ def _build_session() -> requests.Session:
     return session
 
 
+# Shared module-level session so product detail lookups reuse the TLS connection
+SESSION = _build_session()
+
+
 def _normalize_url(base: str, url: str) -> str:
     if not url:
         return ""
@@ -115,6 +113,13 @@ def fetch_harris_products(query: str, max_results: int = 50) -> List[Dict]:
     Fetch products from Harris Farm search page using Selenium for JavaScript rendering.
     """
     from bs4 import BeautifulSoup
+    # Selenium is only needed here, so importing this module stays cheap
+    from selenium import webdriver
+    from selenium.webdriver.common.by import By
+    from selenium.webdriver.support.ui import WebDriverWait
+    from selenium.webdriver.support import expected_conditions as EC
+    from selenium.webdriver.chrome.options import Options
+    from selenium.common.exceptions import TimeoutException
     
     base_url = "https://www.harrisfarm.com.au"
     search_url = (
@@ -202,6 +207,9 @@ def fetch_harris_products(query: str, max_results: int = 50) -> List[Dict]:
             
         print(f"Total product elements to process: {len(product_elements)}")
 
+        # One UTC timestamp per search, shared by every product
+        scraped_at = time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime())
+
         for idx, container in enumerate(product_elements):
             if len(products) >= max_results:
                 break
@@ -323,7 +331,7 @@ def fetch_harris_products(query: str, max_results: int = 50) -> List[Dict]:
                         "productUrl": product_url_full,
                         "brand": brand,
                         "category": "",
-                        "scraped_at": time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime()),
+                        "scraped_at": scraped_at,
                     }
                     
                     products.append(product)
@@ -342,9 +350,8 @@ def get_harris_product_details(product_url: str) -> Dict:
     """Fetch simple product details from a product page."""
     from bs4 import BeautifulSoup  # requires beautifulsoup4
 
-    session = _build_session()
     try:
-        resp = session.get(product_url, timeout=30)
+        resp = SESSION.get(product_url, timeout=30)
         if resp.status_code != 200:
             return {}
         soup = BeautifulSoup(resp.text, "html.parser")
@@ -1,6 +1,88 @@
 import requests
 import time
 import sys
+import logging
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+logger = logging.getLogger(__name__)
+
+# Common headers that might be required
+IGA_HEADERS = {
+    'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36',
+    'Accept': 'application/json, text/plain, */*',
+    'Accept-Language': 'en-US,en;q=0.9',
+    'Accept-Encoding': 'gzip, deflate, br',
+    'Connection': 'keep-alive',
+    'Sec-Fetch-Dest': 'empty',
+    'Sec-Fetch-Mode': 'cors',
+    'Sec-Fetch-Site': 'same-origin'
+}
+
+# IGA storefront search endpoint, formatted with the store id
+IGA_SEARCH_URL_TEMPLATE = "https://www.igashop.com.au/api/storefront/stores/{store_id}/search"
+
+# (connect, read) timeout for IGA API calls
+REQUEST_TIMEOUT = (3.05, 10)
+
+
+def _build_session():
+    """Create a pooled keep-alive session with retries for the IGA API"""
+    session = requests.Session()
+    session.headers.update(IGA_HEADERS)
+    retry = Retry(total=2, backoff_factor=0.3, status_forcelist=[429, 502, 503, 504])
+    session.mount('https://', HTTPAdapter(pool_connections=4, pool_maxsize=16, max_retries=retry))
+    return session
+
+
+# Shared module-level session so repeated searches reuse the TLS connection.
+# Other scrapers may import and share it.
+SESSION = _build_session()
+
+
+# Image size keys in order of preference for the nested 'image' object and the 'images' list
+_IMAGE_KEYS = ('default', 'details', 'cell', 'template', 'zoom', 'url', 'src')
+_IMAGES_KEYS = ('default', 'details', 'url', 'src')
+
+
+def _first_value(mapping, keys):
+    """Return the first truthy value for keys (or the last lookup, like an `or` chain)"""
+    value = None
+    for key in keys:
+        value = mapping.get(key)
+        if value:
+            break
+    return value
+
+
+def _extract_product(item):
+    """Convert one IGA API item into a product dict"""
+    # Handle price - IGA might have different price structure; canonicalize to a dict
+    price_info = item.get('price', {})
+    if not isinstance(price_info, dict):
+        price_info = {'current': price_info}
+    
+    # Handle image URL - IGA has nested image object with multiple sizes
+    image_url = None
+    if 'image' in item:
+        image = item['image']
+        image_url = _first_value(image, _IMAGE_KEYS) if isinstance(image, dict) else image
+    elif 'imageUrl' in item:
+        image_url = item['imageUrl']
+    elif 'images' in item and len(item['images']) > 0:
+        first_image = item['images'][0]
+        image_url = _first_value(first_image, _IMAGES_KEYS) if isinstance(first_image, dict) else first_image
+    
+    return {
+        'name': item.get('name', item.get('title', 'Unknown')),
+        'price': price_info.get('current', price_info.get('amount', 'N/A')),
+        'discount_price': price_info.get('was', price_info.get('originalAmount')),
+        'image': image_url,
+        'brand': item.get('brand', 'IGA'),
+        'unitPrice': item.get('pricePerUnit', 'N/A'),
+        'store': 'IGA'
+    }
+
 
 def fetch_iga_products(query, limit=50, store_id='32600'):
     """
@@ -18,19 +100,7 @@ def fetch_iga_products(query, limit=50, store_id='32600'):
     Returns:
         list: List of product dictionaries (may be empty due to API restrictions)
     """
-    base_url = f"https://www.igashop.com.au/api/storefront/stores/{store_id}/search"
-    
-    # Common headers that might be required
-    headers = {
-        'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36',
-        'Accept': 'application/json, text/plain, */*',
-        'Accept-Language': 'en-US,en;q=0.9',
-        'Accept-Encoding': 'gzip, deflate, br',
-        'Connection': 'keep-alive',
-        'Sec-Fetch-Dest': 'empty',
-        'Sec-Fetch-Mode': 'cors',
-        'Sec-Fetch-Site': 'same-origin'
-    }
+    base_url = IGA_SEARCH_URL_TEMPLATE.format(store_id=store_id)
     
     offset = 0
     products = []
@@ -42,86 +112,35 @@ def fetch_iga_products(query, limit=50, store_id='32600'):
             'take': limit
         }
 
-        response = requests.get(base_url, params=params, headers=headers)
+        response = SESSION.get(base_url, params=params, timeout=REQUEST_TIMEOUT)
         if response.status_code != 200:
-            print(f"Failed to fetch data: HTTP {response.status_code}")
+            logger.warning("IGA search failed: HTTP %s", response.status_code)
             return products
 
-        print(base_url)
+        logger.debug("IGA search URL: %s", base_url)
 
         data = response.json()
         total_available = data.get('total', 0)
         items_returned = data.get('count', 0)
         
-        print(f"API found {total_available} products but returned {items_returned} items")
-        print(f"Available facets: {list(data.get('facets', {}).keys())}")
+        logger.debug("IGA API found %s products but returned %s items", total_available, items_returned)
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Available facets: %s", list(data.get('facets', {}).keys()))
         
         # Check if there are items in the response
         if 'items' in data and len(data['items']) > 0:
             items = data['items']
-            print(f"Processing {len(items)} items...")
+            logger.debug("Processing %d IGA items", len(items))
             
-            for item in items:
-                product = {}
-                product['name'] = item.get('name', item.get('title', 'Unknown'))
-                
-                # Handle price - IGA might have different price structure
-                price_info = item.get('price', {})
-                if isinstance(price_info, dict):
-                    product['price'] = price_info.get('current', price_info.get('amount', 'N/A'))
-                    product['discount_price'] = price_info.get('was', price_info.get('originalAmount'))
-                else:
-                    product['price'] = price_info
-                    product['discount_price'] = None
-                
-                # Handle image URL - IGA has nested image object with multiple sizes
-                image_url = None
-                if 'image' in item:
-                    if isinstance(item['image'], dict):
-                        # Try different image size options in order of preference
-                        image_url = (item['image'].get('default') or 
-                                   item['image'].get('details') or 
-                                   item['image'].get('cell') or 
-                                   item['image'].get('template') or 
-                                   item['image'].get('zoom') or
-                                   item['image'].get('url') or 
-                                   item['image'].get('src'))
-                    else:
-                        image_url = item['image']
-                elif 'imageUrl' in item:
-                    image_url = item['imageUrl']
-                elif 'images' in item and len(item['images']) > 0:
-                    first_image = item['images'][0]
-                    if isinstance(first_image, dict):
-                        image_url = (first_image.get('default') or 
-                                   first_image.get('details') or 
-                                   first_image.get('url') or 
-                                   first_image.get('src'))
-                    else:
-                        image_url = first_image
-                
-                product['image'] = image_url
-                product['brand'] = item.get('brand', 'IGA')
-                product['unitPrice'] = item.get('pricePerUnit', 'N/A')
-                product['store'] = 'IGA'
-                products.append(product)
+            products = [_extract_product(item) for item in items]
         else:
-            print("⚠️  API Limitation: The IGA search API returns metadata but no actual product items.")
-            print("   This likely requires:")
-            print("   - Authentication tokens")
-            print("   - Session cookies from logged-in user")
-            print("   - Special API keys")
-            print("   - Different endpoint structure")
-            print("")
-            print("💡 Alternative approaches:")
-            print("   1. Use the existing browser-based IGA scraper")
-            print("   2. Reverse engineer the web app's API calls")
-            print("   3. Contact IGA for API access")
+            # API Limitation: likely requires auth tokens, session cookies, API keys or a different endpoint
+            logger.warning("IGA search API returned metadata but no product items for %r", query)
 
     except requests.RequestException as e:
-        print(f"Request error: {e}")
+        logger.error("IGA request error: %s", e)
     except Exception as e:
-        print(f"Error processing response: {e}")
+        logger.error("Error processing IGA response: %s", e)
 
     return products
 
@@ -142,19 +161,7 @@ def fetch_iga_special_products(limit_per_page=100, target_products=500, store_id
         list: List of special product dictionaries
     """
     # Use the regular search endpoint which works reliably
-    base_url = f"https://www.igashop.com.au/api/storefront/stores/{store_id}/search"
-    
-    # Headers that work with the search endpoint
-    headers = {
-        'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36',
-        'Accept': 'application/json, text/plain, */*',
-        'Accept-Language': 'en-US,en;q=0.9',
-        'Accept-Encoding': 'gzip, deflate, br',
-        'Connection': 'keep-alive',
-        'Sec-Fetch-Dest': 'empty',
-        'Sec-Fetch-Mode': 'cors',
-        'Sec-Fetch-Site': 'same-origin'
-    }
+    base_url = IGA_SEARCH_URL_TEMPLATE.format(store_id=store_id)
     
     products = []
     special_product_count = 0
@@ -189,7 +196,7 @@ def fetch_iga_special_products(limit_per_page=100, target_products=500, store_id
                 'take': limit_per_page
             }
             
-            response = requests.get(base_url, params=params, headers=headers, timeout=10)
+            response = SESSION.get(base_url, params=params, timeout=10)
             if response.status_code != 200:
                 print(f"Failed to fetch data for query '{query}': HTTP {response.status_code}")
                 continue
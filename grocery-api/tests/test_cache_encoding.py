@@ -0,0 +1,32 @@
+import os
+import sys
+import unittest
+
+# Make the grocery-api root importable when run as `python -m unittest discover -s tests`
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+from src.routes import grocery
+
+
+class RedisCacheEncodingTest(unittest.TestCase):
+    def test_unpriced_product_round_trips_with_inf_price(self):
+        products = [
+            {'title': 'Milk', 'store': 'Coles', 'numericPrice': 2.5},
+            {'title': 'Bread', 'store': 'Coles', 'numericPrice': float('inf')},
+        ]
+
+        decoded = grocery.decode_cache_value(grocery.encode_cache_value(products))
+
+        self.assertEqual(decoded, products)
+        self.assertEqual(decoded[1]['numericPrice'], float('inf'))
+        # The reads the list endpoints do on cached products must keep working
+        self.assertEqual(min(p.get('numericPrice', grocery.INF) for p in decoded), 2.5)
+        self.assertEqual([p for p in decoded if p.get('numericPrice', grocery.INF) <= 10], products[:1])
+
+    def test_tuple_values_come_back_as_lists(self):
+        self.assertEqual(grocery.decode_cache_value(grocery.encode_cache_value({'stores': ('aldi', 'iga')})),
+                         {'stores': ['aldi', 'iga']})
+
+
+if __name__ == '__main__':
+    unittest.main()
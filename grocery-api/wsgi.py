@@ -0,0 +1,7 @@
+"""
+WSGI entry point for production servers.
+
+Run with gunicorn from the grocery-api directory:
+    gunicorn -c gunicorn.conf.py wsgi:app
+"""
+from src.main import app